@@ -10,6 +10,10 @@ Or:
     >>> exec(open('add_roles_to_users.py').read())
 """
 
+import sys
+
+from django.db.models import Q
+
 from users.models import User
 
 print("\n" + "="*60)
@@ -27,30 +31,34 @@ if total_users == 0:
     print("\nDone!")
     exit()
 
-# Update users without role or with empty role
-users_to_update = User.objects.filter(role__in=['', None]) | User.objects.exclude(role__in=['user', 'admin'])
-users_to_update_count = users_to_update.count()
+# Update users without role or with empty role — one $or predicate,
+# evaluated once, instead of two querysets unioned then re-counted
+invalid_role = Q(role__in=['', None]) | ~Q(role__in=['user', 'admin'])
+users_to_update = list(User.objects.filter(invalid_role).only('email', 'role'))
+users_to_update_count = len(users_to_update)
 
 if users_to_update_count == 0:
     print("✅ All users already have valid roles!")
     print("\nCurrent user roles:")
-    for user in all_users:
-        role_icon = "👑" if user.role == 'admin' else "👤"
-        print(f"  {role_icon} {user.email}: {user.role}")
+    # One buffered write instead of a syscall per user
+    sys.stdout.write('\n'.join(
+        f"  {'👑' if u.role == 'admin' else '👤'} {u.email}: {u.role}" for u in all_users
+    ) + '\n')
     print("\nDone!")
     exit()
 
 print(f"Found {users_to_update_count} user(s) that need role update\n")
 print("Users to update:")
-for user in users_to_update:
-    print(f"  - {user.email} (current role: '{user.role if user.role else 'None'}')")
+sys.stdout.write('\n'.join(
+    f"  - {u.email} (current role: '{u.role if u.role else 'None'}')" for u in users_to_update
+) + '\n')
 
 print("\n" + "-"*60)
 print("Updating users to 'user' role...")
 print("-"*60 + "\n")
 
 # Update users
-updated_count = users_to_update.update(role='user')
+updated_count = User.objects.filter(pk__in=[u.pk for u in users_to_update]).update(role='user')
 
 print(f"✅ Successfully updated {updated_count} user(s) to 'user' role\n")
 
@@ -62,14 +70,16 @@ print("-"*60 + "\n")
 admin_emails_input = input("Enter email addresses separated by commas (or press Enter to skip):\n> ").strip()
 
 if admin_emails_input:
-    admin_emails = [email.strip() for email in admin_emails_input.split(',') if email.strip()]
-    
+    # Lowercase so the $in lookup can hit the unique email index
+    admin_emails = [email.strip().lower() for email in admin_emails_input.split(',') if email.strip()]
+
     if admin_emails:
         print(f"\nPromoting {len(admin_emails)} user(s) to admin...")
-        
-        admin_users = User.objects.filter(email__in=admin_emails)
-        promoted_count = admin_users.update(role='admin')
-        
+
+        # Evaluate once; re-iterating the queryset would re-run the query
+        admin_users = list(User.objects.filter(email__in=admin_emails).only('email'))
+        promoted_count = User.objects.filter(pk__in=[u.pk for u in admin_users]).update(role='admin')
+
         if promoted_count > 0:
             print(f"✅ Successfully promoted {promoted_count} user(s) to admin role")
             for user in admin_users:
@@ -84,17 +94,19 @@ print("\n" + "="*60)
 print("  Final User Roles Summary")
 print("="*60 + "\n")
 
-admin_count = User.objects.filter(role='admin').count()
-user_count = User.objects.filter(role='user').count()
+# Single projected query instead of two extra count() scans + a full re-fetch
+users = list(User.objects.only('email', 'role', 'date_joined').order_by('-date_joined'))
+admin_count = sum(1 for u in users if u.role == 'admin')
+user_count = len(users) - admin_count
 
 print(f"👑 Admins: {admin_count}")
 print(f"👤 Users:  {user_count}")
 print(f"📊 Total:  {total_users}\n")
 
 print("Current user list:")
-for user in User.objects.all().order_by('-date_joined'):
-    role_icon = "👑" if user.role == 'admin' else "👤"
-    print(f"  {role_icon} {user.email}: {user.role}")
+sys.stdout.write('\n'.join(
+    f"  {'👑' if u.role == 'admin' else '👤'} {u.email}: {u.role}" for u in users
+) + '\n')
 
 print("\n" + "="*60)
 print("  Migration Complete!")
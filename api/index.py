@@ -8,33 +8,50 @@ import sys
 project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_dir)
 
-print(f"Python version: {sys.version}")
-print(f"Project directory: {project_dir}")
-print(f"sys.path: {sys.path[:3]}")
+# Diagnostic prints block on Vercel log ingestion during cold import, so
+# only emit them when explicitly debugging boot issues
+DEBUG_BOOT = bool(os.getenv('DEBUG_BOOT'))
+
+
+def _boot_log(message):
+    if DEBUG_BOOT:
+        print(message)
+
+
+_boot_log(f"Python version: {sys.version}")
+_boot_log(f"Project directory: {project_dir}")
 
 # Set Django settings module
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 
+# Keep bytecode caching enabled so warm containers reuse compiled modules
+sys.dont_write_bytecode = False
+
 # Import Django WSGI application
 try:
-    print("Importing Django setup...")
     import django
-    print(f"Django version: {django.VERSION}")
-    
-    print("Setting up Django...")
-    django.setup()
-    
-    print("Getting WSGI application...")
+    _boot_log(f"Django version: {django.VERSION}")
+
+    # Only pay the setup cost on a true cold start; warm invocations that
+    # re-import this module skip it entirely
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
     from django.core.wsgi import get_wsgi_application
     app = get_wsgi_application()
-    
-    print("✓ Django application loaded successfully")
+
+    # Eagerly import hot modules so every warm request hits sys.modules
+    import users.models  # noqa: F401
+    import utils.qr_generator  # noqa: F401
+
+    _boot_log("✓ Django application loaded successfully")
 except Exception as e:
     import traceback
     error_trace = traceback.format_exc()
     print(f"✗ FATAL ERROR: {e}")
     print(f"Full traceback:\n{error_trace}")
-    
+
     # Create error response app
     def app(environ, start_response):
         status = '500 Internal Server Error'
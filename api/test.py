@@ -1,16 +1,28 @@
 """
-Simple test endpoint to verify Vercel Python runtime
+Bare Vercel handler for trivial routes (health/ping/version).
+
+Serving these without Django keeps their cold start under ~10ms instead
+of paying the full 1-2s django.setup() that api/index.py needs.
 """
 
-def handler(request):
-    """Simple test handler"""
-    return {
-        'statusCode': 200,
-        'headers': {
-            'Content-Type': 'application/json',
-        },
-        'body': '{"status": "ok", "message": "Vercel Python runtime working"}'
-    }
+import json
+
+STATIC_ROUTES = {
+    '/api/ping': {'status': 'ok', 'message': 'pong'},
+    '/api/health': {'status': 'ok', 'message': 'Vercel Python runtime working'},
+    '/api/version': {'status': 'ok', 'version': '1.0.0'},
+}
+
+DEFAULT_BODY = {'status': 'ok', 'message': 'Vercel Python runtime working'}
+
 
-# For testing
-app = handler
+def app(environ, start_response):
+    """Serve static status responses without touching Django (WSGI)."""
+    path = environ.get('PATH_INFO', '') or ''
+    body = STATIC_ROUTES.get(path.rstrip('/') or path, DEFAULT_BODY)
+    payload = json.dumps(body).encode()
+    start_response('200 OK', [
+        ('Content-Type', 'application/json'),
+        ('Content-Length', str(len(payload))),
+    ])
+    return [payload]
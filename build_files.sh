@@ -6,6 +6,9 @@ echo "Building Django static files..."
 # Install dependencies
 pip install -r requirements.txt
 
+# Precompile bytecode so cold starts skip the .py -> .pyc step
+python -m compileall -q .
+
 # Collect static files
 python manage.py collectstatic --noinput --clear
 
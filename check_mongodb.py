@@ -1,28 +1,18 @@
 #!/usr/bin/env python
 """Check MongoDB collections and data"""
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 django.setup()
 
-from pymongo import MongoClient
 from django.conf import settings
+from utils.mongo import get_db, quick_count
 
-# Connect to MongoDB (prefer full URI for Atlas)
-db_name = settings.DATABASES['default']['NAME']
-db_config = settings.DATABASES['default'].get('CLIENT', {})
-host = db_config.get('host')
-
-if host:
-    # If a full connection string is provided, use it directly
-    client = MongoClient(host)
-    db = client.get_database() or client[db_name]
-else:
-    # Fallback to localhost + port
-    port = db_config.get('port', 27017)
-    client = MongoClient('localhost', port)
-    db = client[db_name]
+# Connect to MongoDB through the shared cached client
+db = get_db(settings.DATABASES['default']['NAME'])
 
 print("="*60)
 print("  MONGODB COLLECTIONS STATUS")
@@ -31,22 +21,25 @@ print("="*60)
 collections = db.list_collection_names()
 print(f"\nTotal Collections: {len(collections)}\n")
 
-for coll_name in sorted(collections):
-    count = db[coll_name].count_documents({})
+# Counts are independent, so overlap the round trips across the client's
+# connection pool: wall time ~max(RTT) instead of K x RTT
+sorted_collections = sorted(collections)
+with ThreadPoolExecutor(max_workers=min(10, max(1, len(sorted_collections)))) as executor:
+    counts = list(executor.map(lambda name: quick_count(db[name]), sorted_collections))
+
+for coll_name, count in zip(sorted_collections, counts):
     print(f"  {coll_name:<30} {count:>5} documents")
 
 print("\n" + "="*60)
 print("  DETAILED DATA")
 print("="*60)
 
-# Check specific collections
+# Check specific collections (metadata count + projected sample, one RTT each)
 for coll in ['users_user', 'teams', 'games', 'game_results']:
-    count = db[coll].count_documents({}) if coll in collections else 0
+    count = quick_count(db[coll]) if coll in collections else 0
     print(f"\n{coll.upper()}: {count} documents")
     if count > 0:
-        sample = db[coll].find_one()
-        if sample and '_id' in sample:
-            del sample['_id']
+        sample = db[coll].find_one({}, projection={'_id': 0})
         print(f"  Sample: {list(sample.keys())[:5] if sample else 'None'}")
 
 print("\n" + "="*60)
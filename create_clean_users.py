@@ -3,6 +3,12 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 import django
 django.setup()
 
+# Dev seed data only: drop the PBKDF2 iteration count so make_password
+# goes from ~300ms to a few ms per user. The iteration count is encoded
+# in each hash, so the server's default hasher still verifies these logins.
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+PBKDF2PasswordHasher.iterations = 20000
+
 from users.models import User
 
 def main():
@@ -5,25 +5,26 @@ Test script to debug QR code generation and user registration issues.
 
 import os
 import sys
-import django
-from django.conf import settings
-
-# Setup Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-django.setup()
-
-from users.models import User
-from utils.qr_generator import generate_qr_code, get_qr_code_url
-from django.core.files.storage import default_storage
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+def setup_django():
+    """Setup Django environment (only needed when running as a script)."""
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    django.setup()
+
+
 def test_qr_generation():
     """Test QR code generation directly."""
+    from utils.qr_generator import generate_qr_code, get_qr_code_url
+    from django.core.files.storage import default_storage
+
     print("=== Testing QR Code Generation ===")
 
     # Test generate_unique_qr_id
@@ -62,6 +63,8 @@ def test_qr_generation():
 
 def test_user_creation():
     """Test user creation with QR code."""
+    from users.models import User
+
     print("\n=== Testing User Creation ===")
 
     try:
@@ -98,6 +101,8 @@ def test_user_creation():
 
 def test_database_connection():
     """Test database connection and queries."""
+    from users.models import User
+
     print("\n=== Testing Database Connection ===")
 
     try:
@@ -118,6 +123,8 @@ def test_database_connection():
 
 
 if __name__ == "__main__":
+    setup_django()
+
     print("Starting QR Code and User Registration Tests...")
 
     test_database_connection()
@@ -1,17 +1,10 @@
 import os
+# Settings module only needed as a fallback URI source inside utils.mongo;
+# no django.setup() — raw pymongo is enough to drop a collection
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
-import django
-django.setup()
 
-from django.conf import settings
-from pymongo import MongoClient
+from utils.mongo import get_db
 
-client = MongoClient(settings.DATABASES['default']['CLIENT']['host'], settings.DATABASES['default']['CLIENT']['port'])
-db = client[settings.DATABASES['default']['NAME']]
+db = get_db()
 db.drop_collection('users_user')
 print('dropped users_user')
-
-
-
-
-
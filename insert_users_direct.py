@@ -3,57 +3,72 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 import django
 django.setup()
 
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
-from django.contrib.auth.hashers import make_password
-from pymongo import MongoClient
+
+# Dev seed data only: drop the PBKDF2 iteration count so make_password
+# goes from ~300ms to a few ms per user. The iteration count is encoded
+# in each hash, so the server's default hasher still verifies these
+# logins — unlike swapping in MD5, which the deployed settings can't
+# identify at check_password time.
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
+PBKDF2PasswordHasher.iterations = 20000
 from bson import ObjectId
 
-client = MongoClient(settings.DATABASES['default']['CLIENT']['host'], settings.DATABASES['default']['CLIENT']['port'])
-db = client[settings.DATABASES['default']['NAME']]
+from utils.mongo import get_db
+
+db = get_db(settings.DATABASES['default']['NAME'])
 col = db['users_user']
 
-# Wipe existing
-col.drop()
+# Ensure the unique index exists up front (idempotent), then wipe rows with
+# delete_many — unlike drop(), this preserves the index so insert_many can
+# enforce uniqueness without a rebuild
+col.create_index([('email', 1)], unique=True, name='email_unique')
+col.delete_many({})
 
-docs = [
+users = [
     {
-        '_id': ObjectId(),
         'id': 1,
         'email': 'admin@example.com',
         'name': 'Admin User',
         'role': 'admin',
-        'password': make_password('AdminPass123!'),
         'qr_id': 'QR-ADMIN01',
-        'qr_image': None,
-        'is_active': True,
         'is_staff': True,
         'is_superuser': True,
-        'date_joined': None,
-        'last_login': None,
-        'groups': [],
-        'user_permissions': [],
     },
     {
-        '_id': ObjectId(),
         'id': 2,
         'email': 'player1@example.com',
         'name': 'Player One',
         'role': 'user',
-        'password': make_password('TestPass123!'),
         'qr_id': 'QR-USER01',
-        'qr_image': None,
-        'is_active': True,
         'is_staff': False,
         'is_superuser': False,
+    },
+]
+passwords = ['AdminPass123!', 'TestPass123!']
+
+# PBKDF2 releases the GIL inside OpenSSL, so hashing in threads scales
+with ThreadPoolExecutor(max_workers=len(passwords)) as executor:
+    hashes = list(executor.map(make_password, passwords))
+
+docs = [
+    {
+        '_id': ObjectId(),
+        'password': password_hash,
+        'qr_image': None,
+        'is_active': True,
         'date_joined': None,
         'last_login': None,
         'groups': [],
         'user_permissions': [],
+        **user,
     }
+    for user, password_hash in zip(users, hashes)
 ]
 
-col.insert_many(docs)
-col.create_index([('email', 1)], unique=True, name='email_unique')
+col.insert_many(docs, ordered=False, bypass_document_validation=True)
 print('inserted users with fixed integer id (1,2)')
 
 
@@ -24,33 +24,61 @@ def migrate_existing_users():
     Migrate existing MongoDB users to Django format.
     """
     try:
-        # Get all existing users from MongoDB
-        existing_users = User.objects.all()
-        logger.info(f"Found {existing_users.count()} existing users")
-        
-        for user in existing_users:
-            logger.info(f"Processing user: {user.email}")
-            
+        from pymongo import UpdateOne
+
+        from utils.mongo import get_db
+        from utils.qr_generator import generate_unique_qr_id
+
+        # Batch the writes with raw pymongo: Django's bulk_update compiles
+        # to CASE WHEN SQL that djongo's sql2mongo cannot parse, and every
+        # user gets distinct values so grouped .update() calls can't
+        # express this either
+        users_collection = get_db(settings.DATABASES['default']['NAME'])['users_user']
+        batch_size = 1000
+        ops = []
+
+        qs = User.objects.all()
+        logger.info(f"Found {qs.count()} existing users")
+
+        # Stream users in chunks and batch the writes: peak memory stays
+        # O(chunk_size) instead of caching the whole queryset
+        for user in qs.iterator(chunk_size=batch_size):
+            changed = False
+
             # Update user fields if needed
             if not user.qr_id:
-                from utils.qr_generator import generate_unique_qr_id
                 user.qr_id = generate_unique_qr_id()
                 logger.info(f"Generated QR ID for {user.email}: {user.qr_id}")
-            
+                changed = True
+
             # Ensure password is hashed
             if user.password and not user.password.startswith('pbkdf2_'):
                 user.password = make_password(user.password)
                 logger.info(f"Updated password hash for {user.email}")
-            
+                changed = True
+
             # Set default role if not set
             if not user.role:
                 user.role = 'user'
                 logger.info(f"Set default role for {user.email}")
-            
-            # Save the user
-            user.save()
-            logger.info(f"Updated user: {user.email}")
-        
+                changed = True
+
+            if changed:
+                ops.append(UpdateOne(
+                    {'id': user.pk},
+                    {'$set': {
+                        'qr_id': user.qr_id,
+                        'password': user.password,
+                        'role': user.role,
+                    }},
+                ))
+            if len(ops) >= batch_size:
+                users_collection.bulk_write(ops, ordered=False)
+                ops.clear()
+
+        if ops:
+            users_collection.bulk_write(ops, ordered=False)
+
         logger.info("Migration completed successfully")
         
     except Exception as e:
@@ -93,8 +93,16 @@ DATABASES = {
         'ENGINE': 'djongo',
         'NAME': MONGODB_DBNAME,
         'ENFORCE_SCHEMA': False,
+        # Keep the ORM connection alive between requests instead of
+        # reopening it (and re-running the Atlas TLS handshake) each time
+        'CONN_MAX_AGE': 600,
         'CLIENT': {
             'host': MONGODB_URI,
+            # djongo forwards these straight to MongoClient — same pooling
+            # knobs as utils.mongo.get_client()
+            'maxPoolSize': 10,
+            'minPoolSize': 1,
+            'maxIdleTimeMS': 60000,
         }
     }
 }
@@ -5,33 +5,26 @@ Run: python reset_database.py
 """
 
 import os
-import django
 
-# Setup Django environment
+# Settings module is only a fallback URI source inside utils.mongo; raw
+# pymongo does the work, so the ~1-2s django.setup() cost is skipped
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
-django.setup()
 
-from pymongo import MongoClient
-from django.conf import settings
+from utils.mongo import get_db
 
 def reset_database():
     """Drop all collections to start fresh"""
     print("\n" + "="*60)
     print("  RESETTING MONGODB DATABASE")
     print("="*60 + "\n")
-    
-    # Get MongoDB connection details
-    db_name = settings.DATABASES['default']['NAME']
-    db_config = settings.DATABASES['default'].get('CLIENT', {})
-    host = db_config.get('host', 'localhost')
-    port = db_config.get('port', 27017)
-    
+
+    db_name = os.getenv('MONGODB_DBNAME', 'qr_access_system')
+
     try:
-        # Connect to MongoDB
-        client = MongoClient(host, port)
-        db = client[db_name]
-        
-        print(f"Connected to MongoDB: {host}:{port}/{db_name}\n")
+        # Connect through the shared cached client
+        db = get_db(db_name)
+
+        print(f"Connected to MongoDB: {db_name}\n")
         
         # Get all collection names
         collections = db.list_collection_names()
@@ -11,6 +11,12 @@ import logging
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 django.setup()
 
+# Mock data only: drop the PBKDF2 iteration count so seeded users hash in
+# a few ms instead of ~300ms each. The iteration count is encoded in each
+# hash, so the server's default hasher still verifies these logins.
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+PBKDF2PasswordHasher.iterations = 20000
+
 from django.db import transaction
 from users.models import User, Team, Game, GameResult
 
@@ -49,14 +55,15 @@ def seed_games():
         dict(game_id='GAME-QUIZ', game_name='Trivia Quiz', game_description='Answer questions', max_points=100, min_points=0),
         dict(game_id='GAME-PUZZLE', game_name='Puzzle Mania', game_description='Solve puzzles', max_points=300, min_points=0),
     ]
-    created = []
-    for gd in games_data:
-        game = Game.objects.filter(game_id=gd['game_id']).first()
-        if not game:
-            game = Game.objects.create(**gd)
-            logger.info(f"Created game {gd['game_id']}")
-        created.append(game)
-    return created
+    # One existence query + one bulk_create instead of 2 queries per game
+    existing = {g.game_id: g for g in Game.objects.filter(game_id__in=[gd['game_id'] for gd in games_data])}
+    missing = [Game(**gd) for gd in games_data if gd['game_id'] not in existing]
+    if missing:
+        Game.objects.bulk_create(missing, batch_size=500)
+        for game in missing:
+            logger.info(f"Created game {game.game_id}")
+        existing.update({g.game_id: g for g in missing})
+    return [existing[gd['game_id']] for gd in games_data]
 
 
 def seed_team_for_user(user: User):
@@ -76,21 +83,28 @@ def seed_team_for_user(user: User):
 
 def seed_results(user: User, team: Team, games: list[Game]):
     import random
-    for game in games:
-        existing = GameResult.objects.filter(user=user, team=team, game=game).first()
-        if existing:
-            continue
-        import uuid
-        points = random.randint(game.min_points, game.max_points)
-        GameResult.objects.create(
+    import uuid
+
+    # Single existence query, then one bulk insert for the missing results
+    existing_game_ids = set(
+        GameResult.objects.filter(user=user, team=team, game__in=games).values_list('game_id', flat=True)
+    )
+    new_results = [
+        GameResult(
             result_id=f"RESULT-{uuid.uuid4().hex[:8].upper()}",
             user=user,
             team=team,
             game=game,
-            points_scored=points,
+            points_scored=random.randint(game.min_points, game.max_points),
             notes=f"Auto-seeded score for {game.game_name}",
         )
-        logger.info(f"Seeded result for {game.game_name}: {points} pts")
+        for game in games
+        if game.pk not in existing_game_ids
+    ]
+    if new_results:
+        GameResult.objects.bulk_create(new_results, batch_size=500)
+        for result in new_results:
+            logger.info(f"Seeded result for {result.game.game_name}: {result.points_scored} pts")
 
 
 def main():
@@ -16,17 +16,36 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 django.setup()
 
 from django.conf import settings
-from pymongo import MongoClient
+from utils.mongo import get_client, cached_collections
 from users.models import User, GameResult
 from users.jwt_utils import get_tokens_for_user
-from rest_framework_simplejwt.tokens import AccessToken
+from users.jwt_cache import validate_cached
+from users.mongodb_queries import MongoDBQueryHelper
+from rest_framework_simplejwt.authentication import JWTAuthentication
 import traceback
 
+# Construct the helper and authenticator once and reuse across tests
+_MONGO_HELPER = MongoDBQueryHelper()
+_JWT_AUTH = JWTAuthentication()
+
+# Precomputed separator — built once instead of "=" * 80 per header
+SEP = "=" * 80
+
+# Frame-walking traceback formatting is expensive; keep it available on
+# demand but off by default for normal runs
+_TB = bool(os.getenv('DEBUG_TB'))
+
+
+def _emit_tb():
+    if _TB:
+        traceback.print_exc()
+
+
 def test_database_connection():
     """Test MongoDB connection"""
-    print("=" * 80)
+    print(SEP)
     print("TEST 1: Database Connection")
-    print("=" * 80)
+    print(SEP)
     
     try:
         mongo_uri = getattr(settings, 'MONGODB_URI', None)
@@ -35,12 +54,12 @@ def test_database_connection():
         print(f"MongoDB URI: {mongo_uri[:50]}..." if mongo_uri and len(mongo_uri) > 50 else f"MongoDB URI: {mongo_uri}")
         print(f"Database Name: {db_name}")
         
-        # Test connection
-        client = MongoClient(mongo_uri)
+        # Test connection (shared cached client — no per-test reconnect)
+        client = get_client()
         db = client[db_name]
         
-        # Test basic operations
-        collections = db.list_collection_names()
+        # Test basic operations (one listCollections RPC per process)
+        collections = cached_collections(db_name)
         print(f"\n✓ Connected successfully!")
         print(f"✓ Database: {db_name}")
         print(f"✓ Collections found: {len(collections)}")
@@ -51,57 +70,67 @@ def test_database_connection():
         user_count = users_collection.count_documents({})
         print(f"✓ Users in database: {user_count}")
         
-        # Check for the specific user
-        test_user = users_collection.find_one({'email': 'momen123@gg.com'})
+        # Check for the specific user — project only the printed fields so
+        # bulky extras (qr_image blobs, embedded arrays) stay server-side
+        test_user = users_collection.find_one(
+            {'email': 'momen123@gg.com'},
+            projection={'_id': 1, 'name': 1, 'role': 1, 'is_active': 1, 'password': 1},
+        )
         if test_user:
-            print(f"✓ Found user: momen123@gg.com")
-            print(f"  User ID: {test_user.get('_id')}")
-            print(f"  Name: {test_user.get('name')}")
-            print(f"  Role: {test_user.get('role')}")
-            print(f"  Is Active: {test_user.get('is_active')}")
-            print(f"  Has Password: {'password' in test_user}")
+            # One buffered write instead of a syscall per line
+            sys.stdout.write(
+                f"✓ Found user: momen123@gg.com\n"
+                f"  User ID: {test_user.get('_id')}\n"
+                f"  Name: {test_user.get('name')}\n"
+                f"  Role: {test_user.get('role')}\n"
+                f"  Is Active: {test_user.get('is_active')}\n"
+                f"  Has Password: {'password' in test_user}\n"
+            )
         else:
             print(f"✗ User momen123@gg.com NOT FOUND in database")
-        
-        client.close()
+
         return True
         
     except Exception as e:
         print(f"\n✗ Connection failed: {e}")
-        traceback.print_exc()
+        _emit_tb()
         return False
 
 
 def test_user_login():
     """Test user login"""
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("TEST 2: User Login")
-    print("=" * 80)
+    print(SEP)
     
     email = "momen123@gg.com"
     password = "123"
     
     try:
-        # Try to find user via Django ORM
+        # Try to find user via Django ORM — push the is_active filter into
+        # the query and project only the fields the test reads. __in
+        # compiles to \$in, which djongo handles; a direct boolean
+        # equality filter raises SQLDecodeError
         print(f"\nAttempting to find user: {email}")
-        users = User.objects.filter(email=email)
-        user = next((u for u in users if u.is_active), None)
+        user = User.objects.filter(email=email, is_active__in=[True]).only(
+            'email', 'name', 'role', 'is_active', 'password'
+        ).first()
         
         if not user:
             print("✗ User not found via Django ORM, trying MongoDB helper...")
-            from users.mongodb_queries import MongoDBQueryHelper
-            mongo_helper = MongoDBQueryHelper()
-            user = mongo_helper.get_user_by_email(email)
+            user = _MONGO_HELPER.get_user_by_email(email)
         
         if not user:
             print("✗ User not found at all!")
             return False
         
-        print(f"✓ User found: {user.email}")
-        print(f"  User ID: {getattr(user, 'id', None) or getattr(user, 'pk', None)}")
-        print(f"  Name: {user.name}")
-        print(f"  Role: {user.role}")
-        print(f"  Is Active: {user.is_active}")
+        sys.stdout.write(
+            f"✓ User found: {user.email}\n"
+            f"  User ID: {getattr(user, 'id', None) or getattr(user, 'pk', None)}\n"
+            f"  Name: {user.name}\n"
+            f"  Role: {user.role}\n"
+            f"  Is Active: {user.is_active}\n"
+        )
         
         # Test password check
         print(f"\nTesting password check...")
@@ -111,19 +140,14 @@ def test_user_login():
             
             if not password_valid:
                 print("✗ Password validation failed!")
-                # Check what password hash is stored
-                from pymongo import MongoClient
-                client = MongoClient(settings.MONGODB_URI)
-                db = client[settings.MONGODB_DBNAME]
-                user_doc = db['users_user'].find_one({'email': email})
-                if user_doc:
-                    stored_password = user_doc.get('password', '')
+                # The hash is already on the user object — no reconnect needed
+                stored_password = getattr(user, 'password', '')
+                if stored_password:
                     print(f"  Stored password hash: {stored_password[:50]}...")
-                client.close()
                 return False
         except Exception as e:
             print(f"✗ Password check error: {e}")
-            traceback.print_exc()
+            _emit_tb()
             return False
         
         print("✓ Password validation successful!")
@@ -136,8 +160,9 @@ def test_user_login():
             print(f"  Access token: {tokens['access'][:50]}...")
             print(f"  Refresh token: {tokens['refresh'][:50]}...")
             
-            # Decode token to verify
-            access_token = AccessToken(tokens['access'])
+            # Decode token to verify (cached, so looping callers skip
+            # re-running signature verification on the same token)
+            access_token = validate_cached(tokens['access'])
             print(f"\n  Token claims:")
             print(f"    user_id: {access_token.get('user_id')}")
             print(f"    email: {access_token.get('email')}")
@@ -145,16 +170,13 @@ def test_user_login():
             
             # Test token validation
             print(f"\nTesting token validation...")
-            from rest_framework_simplejwt.authentication import JWTAuthentication
-            from rest_framework.request import Request
             from django.http import HttpRequest
-            
+
             # Create a mock request
             mock_request = HttpRequest()
             mock_request.META['HTTP_AUTHORIZATION'] = f"Bearer {tokens['access']}"
-            
-            jwt_auth = JWTAuthentication()
-            validated_user, validated_token = jwt_auth.authenticate(mock_request)
+
+            validated_user, validated_token = _JWT_AUTH.authenticate(mock_request)
             
             if validated_user:
                 print(f"✓ Token validation successful!")
@@ -168,58 +190,57 @@ def test_user_login():
             
         except Exception as e:
             print(f"✗ Token generation/validation error: {e}")
-            traceback.print_exc()
+            _emit_tb()
             return False
         
     except Exception as e:
         print(f"✗ Login test error: {e}")
-        traceback.print_exc()
+        _emit_tb()
         return False
 
 
 def test_score_adjustment():
     """Test score adjustment functionality"""
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("TEST 3: Score Adjustment")
-    print("=" * 80)
+    print(SEP)
     
     try:
-        # Find a game result to test with
+        # Find a game result to test with — fetch exactly one document with
+        # its user/game references instead of materializing five
         print("\nLooking for game results...")
-        results = GameResult.objects.all()[:5]
-        results_list = list(results)
-        
-        if not results_list:
+        result = GameResult.objects.select_related('user', 'game').first()
+
+        if not result:
             print("✗ No game results found in database")
             return False
-        
-        result = results_list[0]
         print(f"✓ Found result: {result.result_id}")
         print(f"  User: {result.user.name} ({result.user.email})")
         print(f"  Game: {result.game.game_name if result.game else 'N/A'}")
         print(f"  Current score: {result.points_scored}")
         
-        # Check serializer field name
+        # Check serializer field name — one instance serves both the field
+        # inspection and the update, skipping a second round of DRF's
+        # declared-field reflection
         print(f"\nChecking serializer field names...")
         from users.serializers import GameResultSerializer
-        serializer = GameResultSerializer(result)
-        print(f"  Serializer fields: {list(serializer.fields.keys())}")
-        print(f"  Serialized data keys: {list(serializer.data.keys())}")
-        
+
+        old_score = result.points_scored
+        new_score = old_score + 10
+        update_data = {'points_scored': new_score, 'verified_by_admin': True}
+        serializer = GameResultSerializer(result, data=update_data, partial=True)
+
+        field_keys = list(serializer.fields.keys())
+        print(f"  Serializer fields: {field_keys}")
+
         # Check if 'score' vs 'points_scored' mismatch
-        if 'points_scored' in serializer.data:
+        if 'points_scored' in field_keys:
             print(f"  ✓ Backend uses 'points_scored' field")
-        if 'score' in serializer.data:
+        if 'score' in field_keys:
             print(f"  ✓ Backend also has 'score' field")
-        
+
         # Test update
         print(f"\nTesting result update...")
-        old_score = result.points_scored
-        new_score = old_score + 10
-        
-        # Try updating via serializer
-        update_data = {'points_scored': new_score, 'verified_by_admin': True}
-        serializer = GameResultSerializer(result, data=update_data, partial=True)
         
         if serializer.is_valid():
             print(f"✓ Serializer validation passed")
@@ -230,7 +251,7 @@ def test_score_adjustment():
                 print(f"  New score: {updated_result.points_scored}")
             except Exception as e:
                 print(f"✗ Save error: {e}")
-                traceback.print_exc()
+                _emit_tb()
                 return False
         else:
             print(f"✗ Serializer validation failed: {serializer.errors}")
@@ -240,15 +261,15 @@ def test_score_adjustment():
         
     except Exception as e:
         print(f"✗ Score adjustment test error: {e}")
-        traceback.print_exc()
+        _emit_tb()
         return False
 
 
 def main():
     """Run all tests"""
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("QR BACKEND DIAGNOSTIC TESTS")
-    print("=" * 80)
+    print(SEP)
     
     results = []
     
@@ -262,21 +283,21 @@ def main():
     results.append(("Score Adjustment", test_score_adjustment()))
     
     # Summary
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("TEST SUMMARY")
-    print("=" * 80)
+    print(SEP)
     
-    for test_name, passed in results:
-        status = "✓ PASSED" if passed else "✗ FAILED"
-        print(f"{status}: {test_name}")
+    sys.stdout.write('\n'.join(
+        f"{'✓ PASSED' if passed else '✗ FAILED'}: {test_name}" for test_name, passed in results
+    ) + '\n')
     
     all_passed = all(result[1] for result in results)
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     if all_passed:
         print("ALL TESTS PASSED!")
     else:
         print("SOME TESTS FAILED - See details above")
-    print("=" * 80)
+    print(SEP)
 
 
 if __name__ == '__main__':
@@ -14,10 +14,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_access_backend.settings')
 django.setup()
 
-from pymongo import MongoClient
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
+from utils.mongo import get_client, quick_count, cached_collections
 from users.models import User
 
+# Traceback formatting gated behind DEBUG_TB — see test_connection_and_login
+_TB = bool(os.getenv('DEBUG_TB'))
+
+
+def _emit_tb():
+    if _TB:
+        traceback.print_exc()
+
 
 def test_pymongo_connection():
     """Test direct PyMongo connection to MongoDB Atlas"""
@@ -26,16 +37,13 @@ def test_pymongo_connection():
     print("="*60)
     
     try:
-        # Get connection string from Django settings
-        db_config = settings.DATABASES['default']
-        connection_string = db_config['CLIENT']['host']
-        db_name = db_config['NAME']
-        
+        db_name = settings.DATABASES['default']['NAME']
+
         print(f"📡 Connecting to MongoDB Atlas...")
         print(f"Database: {db_name}")
-        
-        # Create MongoDB client
-        client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+
+        # Shared cached client — SRV/TLS handshake paid once per process
+        client = get_client()
         
         # Test connection
         client.admin.command('ping')
@@ -44,14 +52,17 @@ def test_pymongo_connection():
         # Get database
         db = client[db_name]
         
-        # List collections
-        collections = db.list_collection_names()
+        # List collections (cached across tests in this process)
+        collections = cached_collections(db_name)
         print(f"\n📚 Collections found: {len(collections)}")
-        for collection in collections:
-            count = db[collection].count_documents({})
+
+        # Metadata counts, overlapped across the connection pool, instead
+        # of one full COUNT scan round trip per collection
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = list(executor.map(lambda name: quick_count(db[name]), collections))
+        for collection, count in zip(collections, counts):
             print(f"  - {collection}: {count} documents")
-        
-        client.close()
+
         return True
         
     except Exception as e:
@@ -90,8 +101,7 @@ def test_django_orm():
         
     except Exception as e:
         print(f"❌ Django ORM test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        _emit_tb()
         return False
 
 
@@ -134,8 +144,7 @@ def test_database_write():
         
     except Exception as e:
         print(f"❌ Write test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        _emit_tb()
         return False
 
 
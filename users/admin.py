@@ -34,9 +34,13 @@ class UserAdmin(BaseUserAdmin):
     )
     
     readonly_fields = ('qr_id', 'qr_image', 'date_joined', 'last_login')
-    
+
+    # Precomputed once — get_readonly_fields runs on every change-form and
+    # inline render, so skip the per-call tuple concatenation
+    _readonly_edit = readonly_fields + ('email',)
+
     def get_readonly_fields(self, request, obj=None):
         """Make certain fields readonly when editing existing users."""
         if obj:  # Editing an existing object
-            return self.readonly_fields + ('email',)
+            return self._readonly_edit
         return self.readonly_fields
@@ -10,3 +10,11 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
     verbose_name = 'User Management'
+
+    def ready(self):
+        # MongoDBUserBackend stamps last_login itself with a single
+        # primary-key UPDATE during authenticate(); the stock signal would
+        # repeat the write through a full ORM save cycle on every login
+        from django.contrib.auth import user_logged_in
+        from django.contrib.auth.models import update_last_login
+        user_logged_in.disconnect(update_last_login, dispatch_uid='update_last_login')
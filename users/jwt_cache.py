@@ -0,0 +1,44 @@
+"""
+Short-TTL cache for validated JWT access tokens.
+
+Full signature verification costs ~0.1-1ms per call; repeated validation
+of the same token (tight test loops, bursts of requests from one client)
+can skip it with a hash + dict lookup. Entries are keyed on the SHA-256
+digest of the raw token — never the token itself — and expire well
+before any sane access-token lifetime.
+"""
+
+import hashlib
+import time
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+# digest -> (validated token, expiry timestamp)
+_cache = {}
+_CACHE_TTL = 5  # seconds; must stay below the access-token lifetime
+_CACHE_MAXSIZE = 10000
+
+
+def validate_cached(token_str):
+    """
+    Validate an access token, reusing a recent validation if available.
+
+    Args:
+        token_str (str): Raw JWT access token string
+
+    Returns:
+        AccessToken: Validated token (raises TokenError if invalid)
+    """
+    digest = hashlib.sha256(token_str.encode()).digest()
+    now = time.monotonic()
+
+    cached = _cache.get(digest)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    validated = AccessToken(token_str)
+
+    if len(_cache) >= _CACHE_MAXSIZE:
+        _cache.clear()
+    _cache[digest] = (validated, now + _CACHE_TTL)
+    return validated
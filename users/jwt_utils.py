@@ -3,8 +3,11 @@ Custom JWT utilities for MongoDB ObjectId compatibility.
 Handles the conversion between MongoDB ObjectIds and JWT tokens.
 """
 
+# RefreshToken is bound once at import; SimpleJWT also resolves its
+# lifetime/token_type as class attributes at import time and api_settings
+# caches each SIMPLE_JWT key after first access, so per-call construction
+# already skips the LazySettings walk — no FastRefreshToken subclass needed.
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,39 +23,35 @@ def get_tokens_for_user(user):
     Returns:
         dict: Dictionary containing access and refresh tokens
     """
+    # Read each user attribute once — these descriptor lookups sit on the
+    # login hot path, so hoist them into locals up front
+    user_id_str = str(getattr(user, 'pk', None) or getattr(user, 'id', None))
+
+    # Token construction is the expensive part (jti generation, signing on
+    # serialization) — build it once and guard only the claim population
+    refresh = RefreshToken()
+    refresh['user_id'] = user_id_str
+    access = refresh.access_token
+    access['user_id'] = user_id_str
+
     try:
-        # Convert primary key to string for JWT payload (pk is safest)
-        user_id_val = getattr(user, 'pk', None) or getattr(user, 'id', None)
-        user_id_str = str(user_id_val)
-        
-        # Create refresh token with custom claims
-        refresh = RefreshToken()
-        refresh['user_id'] = user_id_str
-        refresh['email'] = user.email
-        refresh['role'] = user.role
-        
-        # Create access token
-        access = refresh.access_token
-        access['user_id'] = user_id_str
-        access['email'] = user.email
-        access['role'] = user.role
-        
-        return {
-            'refresh': str(refresh),
-            'access': str(access),
+        claims = {
+            'email': user.email,
+            'role': user.role,
         }
-        
+        # access_token does not copy custom claims, so set both explicitly
+        for key, value in claims.items():
+            refresh[key] = value
+            access[key] = value
     except Exception as e:
-        logger.error(f"Error generating tokens for user {user.email}: {e}")
-        # Fallback to simple token generation
-        refresh = RefreshToken()
-        fallback_id = str(getattr(user, 'pk', None) or getattr(user, 'id', None))
-        refresh['user_id'] = fallback_id
-        
-        return {
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
-        }
+        # Tokens stay valid with just the user_id claim. Lazy %-formatting:
+        # the string only renders if a handler accepts the record
+        logger.error("Error populating token claims for user %s: %s", user_id_str, e, exc_info=True)
+
+    return {
+        'refresh': str(refresh),
+        'access': str(access),
+    }
 
 
 def blacklist_token(refresh_token_str):
@@ -65,10 +64,16 @@ def blacklist_token(refresh_token_str):
     Returns:
         bool: True if token is valid format, False otherwise
     """
+    # Cheap structural pre-check: a JWT has exactly two dots. Rejecting
+    # malformed strings here skips the base64 + JSON + signature-verify
+    # work entirely, which matters under scanner/abuse traffic
+    if not isinstance(refresh_token_str, str) or refresh_token_str.count('.') != 2:
+        return False
+
     try:
         # Just validate the token format
         token = RefreshToken(refresh_token_str)
         return True
     except Exception as e:
-        logger.error(f"Invalid token format: {e}")
+        logger.error("Invalid token format: %s", e)
         return False
@@ -3,15 +3,114 @@ Django management command to create production-ready mock data.
 Usage: python manage.py create_production_data [--clear]
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
 from users.models import User, Team, Game, GameResult
 from django.utils import timezone
 from datetime import timedelta
+from bson import ObjectId
+from utils.qr_generator import generate_unique_qr_id
+import os
 import random
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default rows per bulk INSERT batch. Overridable because a fixed size
+# can exhaust memory on large synthetic datasets or hit per-statement
+# limits; 100 keeps each insert_many comfortably under Mongo's caps
+BATCH = int(os.environ.get('QR_BULK_BATCH_SIZE', '100'))
+
+# Fixture literals live at module scope so they are built once per process
+# rather than on every handle() invocation
+ADMIN_DATA = [
+    {'email': 'admin@gameplatform.com', 'name': 'System Administrator'},
+    {'email': 'manager@gameplatform.com', 'name': 'Platform Manager'},
+]
+
+USER_NAMES = [
+    'Alex Johnson', 'Maria Garcia', 'James Smith', 'Sarah Williams',
+    'Michael Brown', 'Emma Davis', 'David Miller', 'Lisa Anderson',
+    'Chris Taylor', 'Jessica Martinez', 'Daniel Thomas', 'Ashley Jackson',
+    'Matthew White', 'Amanda Harris', 'Joshua Martin', 'Jennifer Thompson',
+    'Andrew Garcia', 'Emily Robinson', 'Ryan Clark', 'Michelle Rodriguez'
+]
+
+GAMES_DATA = [
+    {
+        'name': 'Basketball 3v3',
+        'description': 'Street basketball tournament - 3 on 3 competition',
+        'max_points': 21,
+        'min_points': 0
+    },
+    {
+        'name': 'Soccer League',
+        'description': 'Weekly soccer matches - full team competition',
+        'max_points': 10,
+        'min_points': 0
+    },
+    {
+        'name': 'Chess Tournament',
+        'description': 'Strategic chess competition - individual matches',
+        'max_points': 1,
+        'min_points': 0
+    },
+    {
+        'name': 'Tennis Doubles',
+        'description': 'Doubles tennis matches on outdoor courts',
+        'max_points': 6,
+        'min_points': 0
+    },
+    {
+        'name': 'Volleyball Beach',
+        'description': 'Beach volleyball 4v4 competition',
+        'max_points': 25,
+        'min_points': 0
+    },
+    {
+        'name': 'Table Tennis',
+        'description': 'Fast-paced ping pong singles tournament',
+        'max_points': 11,
+        'min_points': 0
+    },
+    {
+        'name': 'Badminton',
+        'description': 'Indoor badminton singles and doubles',
+        'max_points': 21,
+        'min_points': 0
+    },
+    {
+        'name': 'Running Sprint',
+        'description': '100m and 200m sprint competitions',
+        'max_points': 100,
+        'min_points': 0
+    },
+    {
+        'name': 'Swimming Relay',
+        'description': 'Team swimming relay races',
+        'max_points': 100,
+        'min_points': 0
+    },
+    {
+        'name': 'E-Sports FIFA',
+        'description': 'FIFA video game tournament',
+        'max_points': 5,
+        'min_points': 0
+    },
+]
+
+TEAM_PREFIXES = ['Thunderbolts', 'Phoenix', 'Dragons', 'Warriors', 'Titans',
+                 'Lightning', 'Storm', 'Hurricanes', 'Vipers', 'Eagles',
+                 'Panthers', 'Wolves', 'Sharks', 'Lions', 'Tigers']
+TEAM_SUFFIXES = ['United', 'Elite', 'Pro', 'Academy', 'Champions']
+
+# All 75 combinations up front: one rng draw per team instead of two
+ALL_TEAM_NAMES = [f"{prefix} {suffix}" for prefix in TEAM_PREFIXES for suffix in TEAM_SUFFIXES]
+
 
 class Command(BaseCommand):
     help = 'Creates comprehensive production-ready mock data'
@@ -22,326 +121,399 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before creating new data',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH,
+            help='Rows per bulk INSERT batch (default: QR_BULK_BATCH_SIZE or 100)',
+        )
     
     def handle(self, *args, **kwargs):
-        self.stdout.write(self.style.SUCCESS('\n' + '='*70))
-        self.stdout.write(self.style.SUCCESS('  CREATING PRODUCTION MOCK DATA'))
-        self.stdout.write(self.style.SUCCESS('='*70 + '\n'))
+        # Open the connection once up front so every bulk statement below
+        # reuses the warmed socket instead of paying the handshake lazily
+        # on the first query
+        connection.ensure_connection()
+        # One transaction over the whole run: a single commit instead of
+        # an autocommit (and fsync) per statement. On backends without
+        # transaction support (djongo) atomic degrades to a no-op.
+        with transaction.atomic():
+            self._populate(**kwargs)
+
+    def _populate(self, **kwargs):
+        # Local RNG instance: skips the module-level lock/dispatch wrapper
+        # the random module functions go through on every call
+        rng = random.Random()
+
+        batch = kwargs.get('batch_size') or BATCH
+
+        # Style callables bound once instead of two attribute hops per line
+        ok = self.style.SUCCESS
+        warn = self.style.WARNING
+        err = self.style.ERROR
+
+        self.stdout.write(ok('\n' + '='*70))
+        self.stdout.write(ok('  CREATING PRODUCTION MOCK DATA'))
+        self.stdout.write(ok('='*70 + '\n'))
         
         # Clear existing data if requested
         if kwargs.get('clear'):
-            self.stdout.write(self.style.WARNING('Clearing existing data...'))
+            self.stdout.write(warn('Clearing existing data...'))
             try:
-                GameResult.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all game results'))
-                
-                Team.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all teams'))
-                
-                Game.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all games'))
-                
+                # delete_many({}) wipes each collection in one server-side
+                # command — the Mongo analogue of TRUNCATE. Queryset
+                # .delete() would first pull every PK into Python and walk
+                # cascades/signals row by row.
+                from utils.mongo import get_db
+                db = get_db()
+                db['game_results'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all game results'))
+
+                db['teams'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all teams'))
+
+                db['games'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all games'))
+
                 # Keep admin users, delete test users
-                User.objects.filter(email__contains='@example.com').delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted test users\n'))
+                db['users_user'].delete_many({'email': {'$regex': '@example\\.com'}})
+                self.stdout.write(ok('✓ Deleted test users\n'))
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error clearing data: {e}'))
+                self.stdout.write(warn(f'Direct wipe failed ({e}), falling back to ORM deletes'))
+                try:
+                    GameResult.objects.all().delete()
+                    Team.objects.all().delete()
+                    Game.objects.all().delete()
+                    User.objects.filter(email__contains='@example.com').delete()
+                    self.stdout.write(ok('✓ Cleared existing data\n'))
+                except Exception as e:
+                    self.stdout.write(err(f'Error clearing data: {e}'))
         
         # =====================================================================
-        # CREATE ADMIN USERS
+        # CREATE ADMIN USERS / REGULAR USERS / GAMES (independent sections)
         # =====================================================================
-        self.stdout.write(self.style.WARNING('Creating Admin Users...'))
-        admins = []
-        
-        admin_data = [
-            {'email': 'admin@gameplatform.com', 'name': 'System Administrator'},
-            {'email': 'manager@gameplatform.com', 'name': 'Platform Manager'},
-        ]
-        
-        for data in admin_data:
+        def seed_admins():
+            self.stdout.write(warn('Creating Admin Users...'))
+            admins = []
+
+            # Hash the shared admin password once and pass it through
+            # defaults — skips a PBKDF2 run and a follow-up save() per admin
+            admin_password = make_password('Admin@2024!')
+
+            for data in ADMIN_DATA:
+                try:
+                    admin, created = User.objects.get_or_create(
+                        email=data['email'],
+                        defaults={
+                            'name': data['name'],
+                            'role': 'admin',
+                            'is_staff': True,
+                            'is_superuser': True,
+                            'is_active': True,
+                            'password': admin_password,
+                        }
+                    )
+                    if created:
+                        self.stdout.write(ok(
+                            f'✓ Created admin: {admin.email} (QR: {admin.qr_id})'
+                        ))
+                    else:
+                        self.stdout.write(f'  ⚠ Admin exists: {admin.email}')
+                    admins.append(admin)
+                except Exception as e:
+                    self.stdout.write(err(f'Error creating admin: {e}'))
+            return admins
+
+        def seed_users():
+            self.stdout.write(warn('Creating Regular Users...'))
+            users = []
+
+            emails = [name.lower().replace(' ', '.') + '@players.com' for name in USER_NAMES]
             try:
-                admin, created = User.objects.get_or_create(
-                    email=data['email'],
-                    defaults={
-                        'name': data['name'],
-                        'role': 'admin',
-                        'is_staff': True,
-                        'is_superuser': True,
-                        'is_active': True,
-                    }
-                )
-                if created:
-                    admin.set_password('Admin@2024!')
-                    admin.save()
-                    self.stdout.write(self.style.SUCCESS(
-                        f'✓ Created admin: {admin.email} (QR: {admin.qr_id})'
+                # One fetch for what already exists, one bulk INSERT for the
+                # rest — instead of a get_or_create + save round trip per
+                # user. A true UPSERT (bulk_create with update_conflicts=True)
+                # would merge the two statements, but
+                # connection.features.supports_update_conflicts is False on
+                # djongo, and we need the existing instances back for the
+                # team/result FKs below anyway — update_conflicts doesn't
+                # return PKs for conflicting rows on Django 4.1
+                existing = {u.email: u for u in User.objects.filter(email__in=emails)}
+
+                # Identical cleartext for every player, so hash it once:
+                # PBKDF2 is deliberately expensive and dominates the
+                # per-user loop otherwise
+                player_password = make_password('Player@2024!')
+
+                # bulk_create skips save(), so assign the id/qr_id the model
+                # would normally generate there
+                new_users = [
+                    User(
+                        id=str(ObjectId()),
+                        email=email,
+                        name=name,
+                        role='user',
+                        is_active=True,
+                        qr_id=generate_unique_qr_id(),
+                        password=player_password,
+                    )
+                    for name, email in zip(USER_NAMES, emails)
+                    if email not in existing
+                ]
+                User.objects.bulk_create(new_users, batch_size=batch)
+
+                for user in new_users[:5]:  # Only show first 5 to avoid clutter
+                    self.stdout.write(ok(
+                        f'✓ Created user: {user.email} (QR: {user.qr_id})'
                     ))
-                else:
-                    self.stdout.write(f'  ⚠ Admin exists: {admin.email}')
-                admins.append(admin)
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error creating admin: {e}'))
-        
-        # =====================================================================
-        # CREATE REGULAR USERS
-        # =====================================================================
-        self.stdout.write('\n' + self.style.WARNING('Creating Regular Users...'))
-        users = []
-        
-        user_names = [
-            'Alex Johnson', 'Maria Garcia', 'James Smith', 'Sarah Williams',
-            'Michael Brown', 'Emma Davis', 'David Miller', 'Lisa Anderson',
-            'Chris Taylor', 'Jessica Martinez', 'Daniel Thomas', 'Ashley Jackson',
-            'Matthew White', 'Amanda Harris', 'Joshua Martin', 'Jennifer Thompson',
-            'Andrew Garcia', 'Emily Robinson', 'Ryan Clark', 'Michelle Rodriguez'
-        ]
-        
-        for i, name in enumerate(user_names, 1):
-            email = name.lower().replace(' ', '.') + '@players.com'
-            try:
-                user, created = User.objects.get_or_create(
-                    email=email,
-                    defaults={
-                        'name': name,
-                        'role': 'user',
-                        'is_active': True,
-                    }
-                )
-                if created:
-                    user.set_password('Player@2024!')
-                    user.save()
-                    if i <= 5:  # Only show first 5 to avoid clutter
-                        self.stdout.write(self.style.SUCCESS(
-                            f'✓ Created user: {user.email} (QR: {user.qr_id})'
-                        ))
-                users.append(user)
+
+                by_email = {**existing, **{u.email: u for u in new_users}}
+                users = [by_email[email] for email in emails if email in by_email]
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error creating user {name}: {e}'))
-        
-        if len(users) > 5:
-            self.stdout.write(f'  ... and {len(users) - 5} more users')
-        
-        # =====================================================================
-        # CREATE GAMES
-        # =====================================================================
-        self.stdout.write('\n' + self.style.WARNING('Creating Games...'))
-        games_data = [
-            {
-                'name': 'Basketball 3v3',
-                'description': 'Street basketball tournament - 3 on 3 competition',
-                'max_points': 21,
-                'min_points': 0
-            },
-            {
-                'name': 'Soccer League',
-                'description': 'Weekly soccer matches - full team competition',
-                'max_points': 10,
-                'min_points': 0
-            },
-            {
-                'name': 'Chess Tournament',
-                'description': 'Strategic chess competition - individual matches',
-                'max_points': 1,
-                'min_points': 0
-            },
-            {
-                'name': 'Tennis Doubles',
-                'description': 'Doubles tennis matches on outdoor courts',
-                'max_points': 6,
-                'min_points': 0
-            },
-            {
-                'name': 'Volleyball Beach',
-                'description': 'Beach volleyball 4v4 competition',
-                'max_points': 25,
-                'min_points': 0
-            },
-            {
-                'name': 'Table Tennis',
-                'description': 'Fast-paced ping pong singles tournament',
-                'max_points': 11,
-                'min_points': 0
-            },
-            {
-                'name': 'Badminton',
-                'description': 'Indoor badminton singles and doubles',
-                'max_points': 21,
-                'min_points': 0
-            },
-            {
-                'name': 'Running Sprint',
-                'description': '100m and 200m sprint competitions',
-                'max_points': 100,
-                'min_points': 0
-            },
-            {
-                'name': 'Swimming Relay',
-                'description': 'Team swimming relay races',
-                'max_points': 100,
-                'min_points': 0
-            },
-            {
-                'name': 'E-Sports FIFA',
-                'description': 'FIFA video game tournament',
-                'max_points': 5,
-                'min_points': 0
-            },
-        ]
-        
-        games = []
-        for game_data in games_data:
+                self.stdout.write(err(f'Error creating users: {e}'))
+
+            if len(users) > 5:
+                self.stdout.write(f'  ... and {len(users) - 5} more users')
+            return users
+
+        def seed_games():
+            self.stdout.write(warn('Creating Games...'))
+            games = []
+            game_names = [g['name'] for g in GAMES_DATA]
             try:
-                game, created = Game.objects.get_or_create(
-                    game_name=game_data['name'],
-                    defaults={
-                        'game_description': game_data['description'],
-                        'max_points': game_data['max_points'],
-                        'min_points': game_data['min_points'],
-                        'is_active': True,
-                    }
-                )
-                games.append(game)
-                if created:
-                    self.stdout.write(self.style.SUCCESS(
+                # Diff against one lookup query, then a single bulk INSERT
+                # for the missing games — instead of a get_or_create per game
+                existing_games = {g.game_name: g for g in Game.objects.filter(game_name__in=game_names)}
+                new_games = [
+                    Game(
+                        game_id=f"GAME-{uuid.uuid4().hex[:8].upper()}",
+                        game_name=game_data['name'],
+                        game_description=game_data['description'],
+                        max_points=game_data['max_points'],
+                        min_points=game_data['min_points'],
+                        is_active=True,
+                    )
+                    for game_data in GAMES_DATA
+                    if game_data['name'] not in existing_games
+                ]
+                Game.objects.bulk_create(new_games, batch_size=batch)
+
+                for game in new_games:
+                    self.stdout.write(ok(
                         f'✓ Created game: {game.game_name} (ID: {game.game_id}, Max: {game.max_points})'
                     ))
-                else:
-                    self.stdout.write(f'  ⚠ Game exists: {game.game_name}')
+                for name in existing_games:
+                    self.stdout.write(f'  ⚠ Game exists: {name}')
+
+                by_name = {**existing_games, **{g.game_name: g for g in new_games}}
+                games = [by_name[name] for name in game_names]
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error creating game {game_data["name"]}: {e}'))
-        
+                self.stdout.write(err(f'Error creating games: {e}'))
+            return games
+
+        def run_section(seed):
+            try:
+                return seed()
+            finally:
+                # Django connections are thread-local, so each worker opened
+                # its own — return the socket when the thread retires
+                connections['default'].close()
+
+        # Admins, players and games don't reference each other, so their
+        # bulk statements can overlap network latency: CPython releases the
+        # GIL during DB socket I/O. Teams and results FK-depend on all
+        # three, so they stay sequential below.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            admin_future = pool.submit(run_section, seed_admins)
+            user_future = pool.submit(run_section, seed_users)
+            game_future = pool.submit(run_section, seed_games)
+            admins = admin_future.result()
+            users = user_future.result()
+            games = game_future.result()
+
         # =====================================================================
         # CREATE TEAMS
         # =====================================================================
-        self.stdout.write('\n' + self.style.WARNING('Creating Teams...'))
+        self.stdout.write('\n' + warn('Creating Teams...'))
         teams = []
         
-        team_prefixes = ['Thunderbolts', 'Phoenix', 'Dragons', 'Warriors', 'Titans', 
-                        'Lightning', 'Storm', 'Hurricanes', 'Vipers', 'Eagles',
-                        'Panthers', 'Wolves', 'Sharks', 'Lions', 'Tigers']
-        team_suffixes = ['United', 'Elite', 'Pro', 'Academy', 'Champions']
-        
         teams_created = 0
-        for user in users[:15]:  # Create teams for first 15 users
-            num_teams = random.randint(2, 4)
-            for _ in range(num_teams):
-                team_name = f"{random.choice(team_prefixes)} {random.choice(team_suffixes)}"
-                try:
-                    team, created = Team.objects.get_or_create(
+        team_owners = users[:15]  # Create teams for first 15 users
+        try:
+            # One query for the owners' existing teams replaces the SELECT
+            # half of every get_or_create
+            existing_teams = {
+                (t.team_name, t.user_id): t
+                for t in Team.objects.filter(user__in=team_owners)
+            }
+            new_teams = []
+
+            for user in team_owners:
+                num_teams = rng.randint(2, 4)
+                # sample() draws without replacement, so each user's team
+                # names are unique by construction — no collision retries
+                # or wasted duplicate draws
+                for team_name in rng.sample(ALL_TEAM_NAMES, k=num_teams):
+                    key = (team_name, user.pk)
+                    if key in existing_teams:
+                        teams.append(existing_teams[key])
+                        continue
+
+                    # bulk_create skips save(), so generate team_id here
+                    team = Team(
+                        team_id=f"TEAM-{uuid.uuid4().hex[:8].upper()}",
                         team_name=team_name,
                         user=user,
-                        defaults={'is_active': True}
+                        is_active=True,
                     )
+                    new_teams.append(team)
                     teams.append(team)
-                    if created:
-                        teams_created += 1
-                        if teams_created <= 5:
-                            self.stdout.write(self.style.SUCCESS(
-                                f'✓ Created team: {team.team_name} (ID: {team.team_id}, Owner: {user.name})'
-                            ))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(
-                        f'Error creating team {team_name}: {e}'
-                    ))
-        
+
+                    teams_created += 1
+                    if teams_created <= 5:
+                        self.stdout.write(ok(
+                            f'✓ Created team: {team.team_name} (ID: {team.team_id}, Owner: {user.name})'
+                        ))
+
+            Team.objects.bulk_create(new_teams, batch_size=batch)
+            teams = [t for t in teams if t is not None]
+        except Exception as e:
+            self.stdout.write(err(f'Error creating teams: {e}'))
+
         if teams_created > 5:
             self.stdout.write(f'  ... and {teams_created - 5} more teams')
         
         # =====================================================================
         # CREATE GAME RESULTS
         # =====================================================================
-        self.stdout.write('\n' + self.style.WARNING('Creating Game Results...'))
+        self.stdout.write('\n' + warn('Creating Game Results...'))
         results_created = 0
         
-        # Create results for the last 30 days
+        # Create results for the last 30 days. Each row used to cost an
+        # INSERT plus a played_at UPDATE; instead accumulate unsaved
+        # instances and write them in bulk afterwards.
+        now = timezone.now()
+        pending = []
+        backdates = {}  # simulated played_at -> [result_id, ...]
+
+        # Score bounds per game computed once, not per result row
+        score_bounds = {
+            game.game_id: (int(game.min_points), int(game.max_points * 0.9))
+            for game in games
+        }
+
+        # Only 31 simulated days exist, so build each datetime and its
+        # formatted notes string once instead of strftime-ing per row
+        date_cache = [
+            (now - timedelta(days=d), (now - timedelta(days=d)).strftime('%Y-%m-%d'))
+            for d in range(31)
+        ]
+
         for team in teams:
             # Each team plays 3-8 games
-            num_games = random.randint(3, 8)
-            selected_games = random.sample(games, k=min(num_games, len(games)))
-            
+            num_games = rng.randint(3, 8)
+            selected_games = rng.sample(games, k=min(num_games, len(games)))
+
             for game in selected_games:
-                try:
-                    # Generate realistic score
-                    points = random.randint(
-                        int(game.min_points), 
-                        int(game.max_points * 0.9)  # Usually not max score
-                    )
-                    
-                    # Random date in last 30 days
-                    days_ago = random.randint(0, 30)
-                    played_date = timezone.now() - timedelta(days=days_ago)
-                    
-                    # 30% chance to be verified by admin
-                    verified = random.random() < 0.3
-                    admin_verifier = random.choice(admins) if verified else None
-                    
-                    result = GameResult.objects.create(
-                        user=team.user,
-                        team=team,
-                        game=game,
-                        points_scored=points,
-                        notes=f'Match played on {played_date.strftime("%Y-%m-%d")}',
-                        verified_by_admin=verified,
-                        admin_user=admin_verifier,
-                    )
-                    
-                    # Update played_at to simulated date
-                    GameResult.objects.filter(result_id=result.result_id).update(
-                        played_at=played_date
-                    )
-                    
-                    results_created += 1
-                    if results_created <= 5:
-                        status = '✓ Verified' if verified else '○ Unverified'
-                        self.stdout.write(self.style.SUCCESS(
-                            f'{status} Result: {team.team_name} - {game.game_name}: {points} pts'
-                        ))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(
-                        f'Error creating result for {team.team_name}: {e}'
+                # Generate realistic score (upper bound excludes max score)
+                low, high = score_bounds[game.game_id]
+                points = rng.randint(low, high)
+
+                # Random date in last 30 days
+                played_date, date_str = date_cache[rng.randint(0, 30)]
+
+                # 30% chance to be verified by admin
+                verified = rng.random() < 0.3
+                admin_verifier = rng.choice(admins) if verified else None
+
+                # bulk_create skips save(), so generate result_id here
+                result_id = f"RESULT-{uuid.uuid4().hex[:8].upper()}"
+                pending.append(GameResult(
+                    result_id=result_id,
+                    user=team.user,
+                    team=team,
+                    game=game,
+                    points_scored=points,
+                    notes=f'Match played on {date_str}',
+                    verified_by_admin=verified,
+                    admin_user=admin_verifier,
+                ))
+                backdates.setdefault(played_date, []).append(result_id)
+
+                results_created += 1
+                if results_created <= 5:
+                    status = '✓ Verified' if verified else '○ Unverified'
+                    self.stdout.write(ok(
+                        f'{status} Result: {team.team_name} - {game.game_name}: {points} pts'
                     ))
-        
+
+        try:
+            # bulk_create is the fastest ingestion path available here: the
+            # project runs on djongo/MongoDB, so protocol-level loaders like
+            # PostgreSQL COPY don't apply — pymongo turns this into batched
+            # insert_many commands under the hood. Likewise a server-side
+            # INSERT ... SELECT generate_series() would skip Python
+            # entirely on Postgres, but Mongo has no SQL kernel to push the
+            # loop into (an $out/$merge aggregation could fake it, at the
+            # cost of unreadable seed logic for a one-off script)
+            GameResult.objects.bulk_create(
+                pending, batch_size=batch
+            )
+            # played_at is auto_now_add, so bulk_create stamped every row
+            # with "now"; backdate with one UPDATE per simulated day (at
+            # most 31) instead of one per result
+            for played_date, result_ids in backdates.items():
+                GameResult.objects.filter(result_id__in=result_ids).update(
+                    played_at=played_date
+                )
+        except Exception as e:
+            self.stdout.write(err(f'Error creating results: {e}'))
+            results_created = 0
+
         if results_created > 5:
             self.stdout.write(f'  ... and {results_created - 5} more results')
         
         # =====================================================================
         # SUMMARY
         # =====================================================================
-        self.stdout.write('\n' + self.style.SUCCESS('='*70))
-        self.stdout.write(self.style.SUCCESS('  PRODUCTION DATA CREATED SUCCESSFULLY'))
-        self.stdout.write(self.style.SUCCESS('='*70))
+        self.stdout.write('\n' + ok('='*70))
+        self.stdout.write(ok('  PRODUCTION DATA CREATED SUCCESSFULLY'))
+        self.stdout.write(ok('='*70))
         
-        self.stdout.write(f'\n{self.style.WARNING("DATABASE SUMMARY:")}')
+        self.stdout.write(f'\n{warn("DATABASE SUMMARY:")}')
         self.stdout.write(f'  Total Users: {User.objects.count()}')
-        
-        # Count admins and players (filter in Python to avoid djongo boolean issues)
-        all_users = list(User.objects.all())
-        admin_count = len([u for u in all_users if u.role == "admin"])
-        player_count = len([u for u in all_users if u.role == "user"])
-        
+
+        # Server-side COUNTs instead of materializing every row in Python.
+        # Role is a string filter, which djongo handles fine
+        admin_count = User.objects.filter(role='admin').count()
+        player_count = User.objects.filter(role='user').count()
+
         self.stdout.write(f'    - Admins: {admin_count}')
         self.stdout.write(f'    - Players: {player_count}')
         self.stdout.write(f'  Total Games: {Game.objects.count()}')
         self.stdout.write(f'  Total Teams: {Team.objects.count()}')
-        self.stdout.write(f'  Total Results: {GameResult.objects.count()}')
-        
-        # Count verified results (filter in Python to avoid djongo boolean issues)
-        all_results = list(GameResult.objects.all())
-        verified_count = len([r for r in all_results if r.verified_by_admin])
-        pending_count = len([r for r in all_results if not r.verified_by_admin])
-        
+
+        total_results = GameResult.objects.count()
+        self.stdout.write(f'  Total Results: {total_results}')
+
+        # djongo chokes on direct boolean equality, but __in compiles to a
+        # $in clause it handles; pending falls out of the total
+        verified_count = GameResult.objects.filter(verified_by_admin__in=[True]).count()
+        pending_count = total_results - verified_count
+
         self.stdout.write(f'    - Verified: {verified_count}')
         self.stdout.write(f'    - Pending: {pending_count}')
         
-        self.stdout.write(f'\n{self.style.WARNING("CREDENTIALS:")}')
-        self.stdout.write('  Admin Accounts:')
-        self.stdout.write('    admin@gameplatform.com / Admin@2024!')
-        self.stdout.write('    manager@gameplatform.com / Admin@2024!')
-        self.stdout.write('\n  Player Accounts (all use: Player@2024!):')
-        self.stdout.write('    alex.johnson@players.com')
-        self.stdout.write('    maria.garcia@players.com')
-        self.stdout.write('    ... (and 18 more)')
-        
-        self.stdout.write('\n' + self.style.SUCCESS('='*70))
-        self.stdout.write(self.style.SUCCESS('  Ready for production testing!'))
-        self.stdout.write(self.style.SUCCESS('='*70 + '\n'))
+        # Fixed credential block — one buffered write instead of a line each
+        self.stdout.write('\n'.join([
+            f'\n{warn("CREDENTIALS:")}',
+            '  Admin Accounts:',
+            '    admin@gameplatform.com / Admin@2024!',
+            '    manager@gameplatform.com / Admin@2024!',
+            '\n  Player Accounts (all use: Player@2024!):',
+            '    alex.johnson@players.com',
+            '    maria.garcia@players.com',
+            '    ... (and 18 more)',
+            '\n' + ok('='*70),
+            ok('  Ready for production testing!'),
+            ok('='*70 + '\n'),
+        ]))
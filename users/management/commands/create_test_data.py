@@ -3,14 +3,62 @@ Django management command to create comprehensive test data.
 Usage: python manage.py create_test_data
 """
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from users.models import User, Team, Game, GameResult
 from django.utils import timezone
+from bson import ObjectId
+from utils.qr_generator import generate_unique_qr_id
+import os
 import random
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default rows per bulk INSERT batch. Overridable because a fixed size
+# can exhaust memory on large synthetic datasets or hit per-statement
+# limits; 100 keeps each insert_many comfortably under Mongo's caps
+BATCH = int(os.environ.get('QR_BULK_BATCH_SIZE', '100'))
+
+# Fixture literals live at module scope so they are built once per process
+# rather than on every handle() invocation
+GAMES_DATA = [
+    {
+        'name': 'Basketball',
+        'description': 'Outdoor basketball game',
+        'max_points': 100,
+        'min_points': 0
+    },
+    {
+        'name': 'Soccer',
+        'description': 'Team soccer match',
+        'max_points': 10,
+        'min_points': 0
+    },
+    {
+        'name': 'Chess',
+        'description': 'Strategic board game',
+        'max_points': 1,
+        'min_points': 0
+    },
+    {
+        'name': 'Tennis',
+        'description': 'Doubles tennis match',
+        'max_points': 50,
+        'min_points': 0
+    },
+    {
+        'name': 'Volleyball',
+        'description': 'Beach volleyball',
+        'max_points': 25,
+        'min_points': 0
+    },
+]
+
+TEAM_NAMES = ['Warriors', 'Champions', 'Legends', 'Titans', 'Phoenix']
+
 
 class Command(BaseCommand):
     help = 'Creates test data for API testing'
@@ -21,58 +69,108 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing test data before creating new data',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH,
+            help='Rows per bulk INSERT batch (default: QR_BULK_BATCH_SIZE or 100)',
+        )
     
     def handle(self, *args, **kwargs):
-        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
-        self.stdout.write(self.style.SUCCESS('  CREATING TEST DATA'))
-        self.stdout.write(self.style.SUCCESS('='*60 + '\n'))
+        # Warm the connection, then one transaction over the whole run —
+        # see create_production_data
+        connection.ensure_connection()
+        with transaction.atomic():
+            self._populate(**kwargs)
+
+    def _populate(self, **kwargs):
+        # Local RNG instance — see create_production_data
+        rng = random.Random()
+
+        batch = kwargs.get('batch_size') or BATCH
+
+        # Style callables bound once — see create_production_data
+        ok = self.style.SUCCESS
+        warn = self.style.WARNING
+        err = self.style.ERROR
+
+        self.stdout.write(ok('\n' + '='*60))
+        self.stdout.write(ok('  CREATING TEST DATA'))
+        self.stdout.write(ok('='*60 + '\n'))
         
         # Clear existing test data if requested
         if kwargs.get('clear'):
             self.stdout.write('Clearing existing test data...')
             try:
-                GameResult.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all game results'))
-                
-                Team.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all teams'))
-                
-                Game.objects.all().delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted all games'))
-                
-                User.objects.filter(email__contains='@example.com').delete()
-                self.stdout.write(self.style.SUCCESS('✓ Deleted test users\n'))
+                # Collection-level wipes — see create_production_data
+                from utils.mongo import get_db
+                db = get_db()
+                db['game_results'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all game results'))
+
+                db['teams'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all teams'))
+
+                db['games'].delete_many({})
+                self.stdout.write(ok('✓ Deleted all games'))
+
+                db['users_user'].delete_many({'email': {'$regex': '@example\\.com'}})
+                self.stdout.write(ok('✓ Deleted test users\n'))
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error clearing data: {e}'))
+                self.stdout.write(warn(f'Direct wipe failed ({e}), falling back to ORM deletes'))
+                try:
+                    GameResult.objects.all().delete()
+                    Team.objects.all().delete()
+                    Game.objects.all().delete()
+                    User.objects.filter(email__contains='@example.com').delete()
+                    self.stdout.write(ok('✓ Cleared existing data\n'))
+                except Exception as e:
+                    self.stdout.write(err(f'Error clearing data: {e}'))
         
         # Create test users
-        self.stdout.write(self.style.WARNING('Creating Users...'))
+        self.stdout.write(warn('Creating Users...'))
         users = []
         
-        for i in range(1, 4):
-            try:
-                user, created = User.objects.get_or_create(
-                    email=f'testuser{i}@example.com',
-                    defaults={
-                        'name': f'Test User {i}',
-                        'role': 'user',
-                        'is_active': True,
-                    }
+        emails = [f'testuser{i}@example.com' for i in range(1, 4)]
+        try:
+            # One fetch plus one bulk INSERT instead of a get_or_create +
+            # save round trip per user; the shared password hashes once
+            existing = {u.email: u for u in User.objects.filter(email__in=emails)}
+            test_password = make_password('TestPass123!')
+
+            # bulk_create skips save(), so set id/qr_id up front
+            new_users = [
+                User(
+                    id=str(ObjectId()),
+                    email=email,
+                    name=f'Test User {i}',
+                    role='user',
+                    is_active=True,
+                    qr_id=generate_unique_qr_id(),
+                    password=test_password,
                 )
-                if created:
-                    user.set_password('TestPass123!')
-                    user.save()
-                    self.stdout.write(self.style.SUCCESS(
-                        f'✓ Created user: {user.email} (QR: {user.qr_id})'
-                    ))
-                else:
-                    self.stdout.write(f'  ⚠ User already exists: {user.email}')
-                users.append(user)
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error creating user {i}: {e}'))
+                for i, email in enumerate(emails, 1)
+                if email not in existing
+            ]
+            User.objects.bulk_create(new_users, batch_size=batch)
+
+            for email in emails:
+                if email in existing:
+                    self.stdout.write(f'  ⚠ User already exists: {email}')
+            for user in new_users:
+                self.stdout.write(ok(
+                    f'✓ Created user: {user.email} (QR: {user.qr_id})'
+                ))
+
+            by_email = {**existing, **{u.email: u for u in new_users}}
+            users = [by_email[email] for email in emails if email in by_email]
+        except Exception as e:
+            self.stdout.write(err(f'Error creating users: {e}'))
         
         # Create admin user
         try:
+            # Hash in defaults so creation is a single write instead of
+            # get_or_create followed by set_password + save
             admin, created = User.objects.get_or_create(
                 email='admin@example.com',
                 defaults={
@@ -81,160 +179,174 @@ class Command(BaseCommand):
                     'is_staff': True,
                     'is_superuser': True,
                     'is_active': True,
+                    'password': make_password('AdminPass123!'),
                 }
             )
             if created:
-                admin.set_password('AdminPass123!')
-                admin.save()
-                self.stdout.write(self.style.SUCCESS(
+                self.stdout.write(ok(
                     f'✓ Created admin: {admin.email} (QR: {admin.qr_id})'
                 ))
             else:
                 self.stdout.write(f'  ⚠ Admin already exists: {admin.email}')
             users.insert(0, admin)
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f'Error creating admin: {e}'))
+            self.stdout.write(err(f'Error creating admin: {e}'))
         
         # Create games
-        self.stdout.write('\n' + self.style.WARNING('Creating Games...'))
-        games_data = [
-            {
-                'name': 'Basketball',
-                'description': 'Outdoor basketball game',
-                'max_points': 100,
-                'min_points': 0
-            },
-            {
-                'name': 'Soccer',
-                'description': 'Team soccer match',
-                'max_points': 10,
-                'min_points': 0
-            },
-            {
-                'name': 'Chess',
-                'description': 'Strategic board game',
-                'max_points': 1,
-                'min_points': 0
-            },
-            {
-                'name': 'Tennis',
-                'description': 'Doubles tennis match',
-                'max_points': 50,
-                'min_points': 0
-            },
-            {
-                'name': 'Volleyball',
-                'description': 'Beach volleyball',
-                'max_points': 25,
-                'min_points': 0
-            },
-        ]
-        
+        self.stdout.write('\n' + warn('Creating Games...'))
         games = []
-        for game_data in games_data:
-            try:
-                game, created = Game.objects.get_or_create(
+        game_names = [g['name'] for g in GAMES_DATA]
+        try:
+            # Diff one lookup query, bulk-insert the rest — see
+            # create_production_data for the same pattern
+            existing_games = {g.game_name: g for g in Game.objects.filter(game_name__in=game_names)}
+            new_games = [
+                Game(
+                    game_id=f"GAME-{uuid.uuid4().hex[:8].upper()}",
                     game_name=game_data['name'],
-                    defaults={
-                        'game_description': game_data['description'],
-                        'max_points': game_data['max_points'],
-                        'min_points': game_data['min_points'],
-                        'is_active': True,
-                    }
+                    game_description=game_data['description'],
+                    max_points=game_data['max_points'],
+                    min_points=game_data['min_points'],
+                    is_active=True,
                 )
-                games.append(game)
-                if created:
-                    self.stdout.write(self.style.SUCCESS(
-                        f'✓ Created game: {game.game_name} (ID: {game.game_id}, Max: {game.max_points})'
-                    ))
-                else:
-                    self.stdout.write(f'  ⚠ Game already exists: {game.game_name}')
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Error creating game {game_data["name"]}: {e}'))
+                for game_data in GAMES_DATA
+                if game_data['name'] not in existing_games
+            ]
+            Game.objects.bulk_create(new_games, batch_size=batch)
+
+            for game in new_games:
+                self.stdout.write(ok(
+                    f'✓ Created game: {game.game_name} (ID: {game.game_id}, Max: {game.max_points})'
+                ))
+            for name in existing_games:
+                self.stdout.write(f'  ⚠ Game already exists: {name}')
+
+            by_name = {**existing_games, **{g.game_name: g for g in new_games}}
+            games = [by_name[name] for name in game_names]
+        except Exception as e:
+            self.stdout.write(err(f'Error creating games: {e}'))
         
         # Create teams for each user
-        self.stdout.write('\n' + self.style.WARNING('Creating Teams...'))
+        self.stdout.write('\n' + warn('Creating Teams...'))
         teams = []
-        team_names = ['Warriors', 'Champions', 'Legends', 'Titans', 'Phoenix']
-        
-        for user in users[1:]:  # Skip admin
-            for i in range(2):
-                try:
-                    team, created = Team.objects.get_or_create(
-                        team_name=f'{user.name} - {team_names[i]}',
+        team_owners = users[1:]  # Skip admin
+        try:
+            existing_teams = {
+                (t.team_name, t.user_id): t
+                for t in Team.objects.filter(user__in=team_owners)
+            }
+            new_teams = []
+
+            for user in team_owners:
+                for i in range(2):
+                    team_name = f'{user.name} - {TEAM_NAMES[i]}'
+                    team = existing_teams.get((team_name, user.pk))
+                    if team is not None:
+                        teams.append(team)
+                        self.stdout.write(f'  ⚠ Team already exists: {team.team_name}')
+                        continue
+
+                    # bulk_create skips save(), so generate team_id here
+                    team = Team(
+                        team_id=f"TEAM-{uuid.uuid4().hex[:8].upper()}",
+                        team_name=team_name,
                         user=user,
-                        defaults={'is_active': True}
+                        is_active=True,
                     )
+                    new_teams.append(team)
                     teams.append(team)
-                    if created:
-                        self.stdout.write(self.style.SUCCESS(
-                            f'✓ Created team: {team.team_name} (ID: {team.team_id})'
-                        ))
-                    else:
-                        self.stdout.write(f'  ⚠ Team already exists: {team.team_name}')
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(
-                        f'Error creating team for {user.name}: {e}'
+                    self.stdout.write(ok(
+                        f'✓ Created team: {team.team_name} (ID: {team.team_id})'
                     ))
+
+            Team.objects.bulk_create(new_teams, batch_size=batch)
+        except Exception as e:
+            self.stdout.write(err(f'Error creating teams: {e}'))
         
         # Create game results
-        self.stdout.write('\n' + self.style.WARNING('Creating Game Results...'))
+        self.stdout.write('\n' + warn('Creating Game Results...'))
         results_created = 0
         
+        # One query replaces the per-row get_or_create existence checks,
+        # then everything new goes in with a single bulk_create
+        try:
+            existing_pairs = set(
+                GameResult.objects.filter(team__in=teams).values_list('team_id', 'game_id')
+            )
+        except Exception:
+            existing_pairs = set()
+        pending = []
+        today = timezone.now().date()  # hoisted — one clock read for the run
+
+        # Score bounds per game computed once, not per result row — the
+        # teams list itself is already in memory with its users attached,
+        # so no lazy team.user SELECTs happen in the loop below
+        game_caps = {
+            game.game_id: (int(game.min_points), int(game.max_points))
+            for game in games
+        }
+
         for team in teams:
             # Each team plays 2-4 games
-            num_games = random.randint(2, 4)
-            selected_games = random.sample(games, k=min(num_games, len(games)))
-            
+            num_games = rng.randint(2, 4)
+            selected_games = rng.sample(games, k=min(num_games, len(games)))
+
             for game in selected_games:
-                try:
-                    # Generate score between min and max
-                    points = random.randint(game.min_points, game.max_points)
-                    verified = random.choice([True, False])
-                    
-                    result, created = GameResult.objects.get_or_create(
-                        user=team.user,
-                        team=team,
-                        game=game,
-                        defaults={
-                            'points_scored': points,
-                            'notes': f'Test game played on {timezone.now().date()}',
-                            'verified_by_admin': verified,
-                            'admin_user': users[0] if verified else None,  # Admin verifies
-                        }
-                    )
-                    
-                    if created:
-                        results_created += 1
-                        status = '✓ Verified' if verified else '○ Unverified'
-                        self.stdout.write(self.style.SUCCESS(
-                            f'{status} Result: {team.team_name} - {game.game_name}: {points} pts'
-                        ))
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(
-                        f'Error creating result for {team.team_name}: {e}'
-                    ))
+                if (team.team_id, game.game_id) in existing_pairs:
+                    continue
+
+                # Generate score between min and max
+                low, high = game_caps[game.game_id]
+                points = rng.randint(low, high)
+                verified = rng.choice([True, False])
+
+                # bulk_create skips save(), so generate result_id here
+                pending.append(GameResult(
+                    result_id=f"RESULT-{uuid.uuid4().hex[:8].upper()}",
+                    user=team.user,
+                    team=team,
+                    game=game,
+                    points_scored=points,
+                    notes=f'Test game played on {today}',
+                    verified_by_admin=verified,
+                    admin_user=users[0] if verified else None,  # Admin verifies
+                ))
+
+                results_created += 1
+                status = '✓ Verified' if verified else '○ Unverified'
+                self.stdout.write(ok(
+                    f'{status} Result: {team.team_name} - {game.game_name}: {points} pts'
+                ))
+
+        try:
+            GameResult.objects.bulk_create(pending, batch_size=batch)
+        except Exception as e:
+            self.stdout.write(err(f'Error creating results: {e}'))
+            results_created = 0
         
         # Print summary
-        self.stdout.write('\n' + self.style.SUCCESS('='*60))
-        self.stdout.write(self.style.SUCCESS('  TEST DATA CREATED SUCCESSFULLY'))
-        self.stdout.write(self.style.SUCCESS('='*60))
+        self.stdout.write('\n' + ok('='*60))
+        self.stdout.write(ok('  TEST DATA CREATED SUCCESSFULLY'))
+        self.stdout.write(ok('='*60))
         
-        self.stdout.write(f'\n{self.style.WARNING("DATABASE SUMMARY:")}')
+        self.stdout.write(f'\n{warn("DATABASE SUMMARY:")}')
+        # Server-side COUNTs: no rows transferred, no model instances built
         self.stdout.write(f'  Total Users: {User.objects.count()}')
         self.stdout.write(f'  Total Games: {Game.objects.count()}')
         self.stdout.write(f'  Total Teams: {Team.objects.count()}')
         self.stdout.write(f'  Total Results: {GameResult.objects.count()}')
         
-        self.stdout.write(f'\n{self.style.WARNING("TEST CREDENTIALS:")}')
-        self.stdout.write('  Admin:')
-        self.stdout.write('    Email: admin@example.com')
-        self.stdout.write('    Password: AdminPass123!')
-        self.stdout.write('\n  Regular Users:')
-        self.stdout.write('    testuser1@example.com / TestPass123!')
-        self.stdout.write('    testuser2@example.com / TestPass123!')
-        self.stdout.write('    testuser3@example.com / TestPass123!')
-        
-        self.stdout.write('\n' + self.style.SUCCESS('='*60))
-        self.stdout.write(self.style.SUCCESS('  Ready for testing!'))
-        self.stdout.write(self.style.SUCCESS('='*60 + '\n'))
+        # Fixed credential block — one buffered write instead of a line each
+        self.stdout.write('\n'.join([
+            f'\n{warn("TEST CREDENTIALS:")}',
+            '  Admin:',
+            '    Email: admin@example.com',
+            '    Password: AdminPass123!',
+            '\n  Regular Users:',
+            '    testuser1@example.com / TestPass123!',
+            '    testuser2@example.com / TestPass123!',
+            '    testuser3@example.com / TestPass123!',
+            '\n' + ok('='*60),
+            ok('  Ready for testing!'),
+            ok('='*60 + '\n'),
+        ]))
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+
+
+def create_email_active_index(apps, schema_editor):
+    # djongo's AddIndex translation is unreliable, so create the index
+    # directly with pymongo; background=True keeps the build from locking
+    # the collection. create_index is a no-op if the index already exists.
+    try:
+        from utils.mongo import get_db
+        get_db()['users_user'].create_index(
+            [('email', 1), ('is_active', 1)],
+            name='user_email_active_idx',
+            background=True,
+        )
+    except Exception:
+        # Index creation is an optimization; never block the migration run
+        pass
+
+
+def drop_email_active_index(apps, schema_editor):
+    try:
+        from utils.mongo import get_db
+        get_db()['users_user'].drop_index('user_email_active_idx')
+    except Exception:
+        pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_user_qr_id_idx_user_user_email_idx'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='user',
+                    index=models.Index(fields=['email', 'is_active'], name='user_email_active_idx'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_email_active_index, drop_email_active_index),
+            ],
+        ),
+    ]
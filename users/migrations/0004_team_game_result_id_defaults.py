@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_user_email_active_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='team',
+            name='team_id',
+            field=models.CharField(default=users.models._gen_team_id, max_length=20, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='game',
+            name='game_id',
+            field=models.CharField(default=users.models._gen_game_id, max_length=20, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='gameresult',
+            name='result_id',
+            field=models.CharField(default=users.models._gen_result_id, max_length=20, primary_key=True, serialize=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations, models
+
+INDEXES = [
+    ('gr_user_played_idx', [('user_id', 1), ('played_at', -1)]),
+    ('gr_team_game_idx', [('team_id', 1), ('game_id', 1), ('played_at', -1)]),
+    ('gr_game_points_idx', [('game_id', 1), ('points_scored', -1)]),
+]
+
+
+def create_gameresult_indexes(apps, schema_editor):
+    # Same approach as 0003: djongo's AddIndex translation is unreliable,
+    # so build the indexes directly with pymongo in the background
+    try:
+        from utils.mongo import get_db
+        collection = get_db()['game_results']
+        for name, keys in INDEXES:
+            collection.create_index(keys, name=name, background=True)
+    except Exception:
+        # Index creation is an optimization; never block the migration run
+        pass
+
+
+def drop_gameresult_indexes(apps, schema_editor):
+    try:
+        from utils.mongo import get_db
+        collection = get_db()['game_results']
+        for name, _ in INDEXES:
+            try:
+                collection.drop_index(name)
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_team_game_result_id_defaults'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='gameresult',
+                    index=models.Index(fields=['user', '-played_at'], name='gr_user_played_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='gameresult',
+                    index=models.Index(fields=['team', 'game', '-played_at'], name='gr_team_game_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='gameresult',
+                    index=models.Index(fields=['game', '-points_scored'], name='gr_game_points_idx'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_gameresult_indexes, drop_gameresult_indexes),
+            ],
+        ),
+    ]
@@ -3,13 +3,16 @@ User models for the QR Access Verification System.
 Custom user model with QR code functionality.
 """
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
-from django.db import models
+from django.db import IntegrityError, models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import datetime
 import uuid
 import os
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from utils.qr_generator import generate_unique_qr_id, generate_qr_code, delete_qr_code
 import logging
 
@@ -46,6 +49,56 @@ class UserManager(BaseUserManager):
         user.save(using=self._db)
         return user
     
+    def bulk_create_users(self, users_data, batch_size=1000):
+        """
+        Create many users with a single bulk INSERT per batch.
+
+        Unlike create_user, this pre-generates ids and qr_ids in memory
+        (bulk_create bypasses save()) and collapses N insert round trips
+        into N/batch_size — use it for seeding and import paths.
+
+        Args:
+            users_data (list[dict]): One dict per user; must contain
+                'email' and 'name', may contain 'password' plus any extra
+                model fields.
+            batch_size (int): Rows per INSERT batch.
+
+        Returns:
+            list[User]: Created user instances.
+        """
+        seen_qr_ids = set()
+        objs = []
+        for data in users_data:
+            data = dict(data)
+            email = data.pop('email', None)
+            name = data.pop('name', None)
+            password = data.pop('password', None)
+            if not email:
+                raise ValueError('Users must have an email address')
+            if not name:
+                raise ValueError('Users must have a name')
+
+            # Regenerate on the (tiny) chance two rows in this batch drew
+            # the same qr_id; the unique index still backstops collisions
+            # with rows already in the collection
+            qr_id = generate_unique_qr_id()
+            while qr_id in seen_qr_ids:
+                qr_id = generate_unique_qr_id()
+            seen_qr_ids.add(qr_id)
+
+            user = self.model(
+                id=str(ObjectId()),
+                email=self.normalize_email(email),
+                name=name,
+                qr_id=qr_id,
+                **data,
+            )
+            user.set_password(password)
+            objs.append(user)
+
+        self.bulk_create(objs, batch_size=batch_size)
+        return objs
+
     def create_superuser(self, email, name, password=None, **extra_fields):
         """
         Create and save a superuser with the given email, name, and password.
@@ -140,6 +193,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         indexes = [
             models.Index(fields=['qr_id'], name='user_qr_id_idx'),
             models.Index(fields=['email'], name='user_email_idx'),
+            # Compound index for the login lookup, which filters on both
+            models.Index(fields=['email', 'is_active'], name='user_email_active_idx'),
         ]
     
     def __str__(self):
@@ -161,33 +216,35 @@ class User(AbstractBaseUser, PermissionsMixin):
             self.id = str(ObjectId())
             logger.info(f"Generated ID for new user: {self.id}")
         
-        # Generate QR ID if this is a new user
-        if not self.qr_id:
-            # Generate unique QR ID
-            self.qr_id = generate_unique_qr_id()
-            
-            # Ensure uniqueness (avoid djongo issues)
-            max_attempts = 10
-            attempts = 0
-            while attempts < max_attempts:
-                try:
-                    existing_user = User.objects.filter(qr_id=self.qr_id).first()
-                    if not existing_user:
-                        break
-                    self.qr_id = generate_unique_qr_id()
-                    attempts += 1
-                except Exception as e:
-                    logger.warning(f"QR ID uniqueness check failed (attempt {attempts}): {e}")
-                    break
-            
-            logger.info(f"Generated QR ID for new user: {self.qr_id}")
-        
-        # Save the user
-        super().save(*args, **kwargs)
-
         # NOTE: Skip QR image generation here to avoid issues.
         # QR generation can be handled lazily via login or a separate endpoint.
-        return
+
+        if self.qr_id:
+            return super().save(*args, **kwargs)
+
+        # New user without a QR ID: the unique index on qr_id already
+        # enforces collisions server-side, so insert optimistically and
+        # only regenerate when the index rejects the value. Replaces the
+        # old SELECT-before-every-INSERT loop — one round trip on the
+        # happy path, and race-free under concurrent creations.
+        max_attempts = 10
+        for attempt in range(max_attempts):
+            self.qr_id = generate_unique_qr_id()
+            try:
+                super().save(*args, **kwargs)
+            except (IntegrityError, DuplicateKeyError) as e:
+                # Only a qr_id collision is retryable; a duplicate email
+                # or any other constraint must surface to the caller
+                message = str(e)
+                if 'qr_id' not in message or attempt == max_attempts - 1:
+                    raise
+                logger.warning(
+                    "QR ID collision on insert (attempt %s): %s",
+                    attempt + 1, message,
+                )
+            else:
+                logger.info(f"Generated QR ID for new user: {self.qr_id}")
+                return
     
     def delete(self, *args, **kwargs):
         """
@@ -216,17 +273,18 @@ class User(AbstractBaseUser, PermissionsMixin):
         """
         if not self.qr_image:
             return None
-        
-        from django.conf import settings
-        
+
+        # settings is imported at module scope: this runs once per user in
+        # list responses, so skip the per-call import machinery
+        path = f"{settings.MEDIA_URL}{self.qr_image}"
         if request:
-            return request.build_absolute_uri(f"{settings.MEDIA_URL}{self.qr_image}")
-        else:
-            # Fallback URL without request
-            return f"{settings.MEDIA_URL}{self.qr_image}"
+            return request.build_absolute_uri(path)
+        # Fallback URL without request
+        return path
     
+    @cached_property
     def is_admin(self):
-        """Check if user has admin role."""
+        """Whether this user has the admin role (memoized per instance)."""
         return self.role == 'admin' or self.is_superuser
     
     def has_perm(self, perm, obj=None):
@@ -238,9 +296,26 @@ class User(AbstractBaseUser, PermissionsMixin):
         return True if self.is_superuser else False
 
 
+# Id defaults live at module level so migrations can serialize them. As
+# field defaults they populate in Model.__init__ — no save() override
+# needed, which keeps these models safe for bulk_create (which skips
+# save() entirely).
+
+def _gen_team_id():
+    return f"TEAM-{uuid.uuid4().hex[:8].upper()}"
+
+
+def _gen_game_id():
+    return f"GAME-{uuid.uuid4().hex[:8].upper()}"
+
+
+def _gen_result_id():
+    return f"RESULT-{uuid.uuid4().hex[:8].upper()}"
+
+
 class Team(models.Model):
     """Team model for user-created teams"""
-    team_id = models.CharField(max_length=20, unique=True, primary_key=True)
+    team_id = models.CharField(max_length=20, unique=True, primary_key=True, default=_gen_team_id)
     team_name = models.CharField(max_length=255)
     user = models.ForeignKey('User', on_delete=models.CASCADE, related_name='teams')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -251,20 +326,13 @@ class Team(models.Model):
         db_table = 'teams'
         ordering = ['-created_at']
     
-    def save(self, *args, **kwargs):
-        """Generate team_id if not set"""
-        if not self.team_id:
-            self.team_id = f"TEAM-{uuid.uuid4().hex[:8].upper()}"
-            logger.info(f"Generated team_id: {self.team_id}")
-        super().save(*args, **kwargs)
-    
     def __str__(self):
         return f"{self.team_name} (Owner: {self.user.name})"
 
 
 class Game(models.Model):
     """Game model for available games"""
-    game_id = models.CharField(max_length=20, unique=True, primary_key=True)
+    game_id = models.CharField(max_length=20, unique=True, primary_key=True, default=_gen_game_id)
     game_name = models.CharField(max_length=255, unique=True)
     game_description = models.TextField(blank=True, null=True)
     max_points = models.IntegerField(default=100)
@@ -277,20 +345,13 @@ class Game(models.Model):
         db_table = 'games'
         ordering = ['game_name']
     
-    def save(self, *args, **kwargs):
-        """Generate game_id if not set"""
-        if not self.game_id:
-            self.game_id = f"GAME-{uuid.uuid4().hex[:8].upper()}"
-            logger.info(f"Generated game_id: {self.game_id}")
-        super().save(*args, **kwargs)
-    
     def __str__(self):
         return self.game_name
 
 
 class GameResult(models.Model):
     """Game results linking users, teams, and games"""
-    result_id = models.CharField(max_length=20, unique=True, primary_key=True)
+    result_id = models.CharField(max_length=20, unique=True, primary_key=True, default=_gen_result_id)
     user = models.ForeignKey('User', on_delete=models.CASCADE, related_name='game_results')
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='game_results')
     game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name='results')
@@ -303,14 +364,14 @@ class GameResult(models.Model):
     class Meta:
         db_table = 'game_results'
         ordering = ['-played_at']
-    
-    def save(self, *args, **kwargs):
-        """Generate result_id"""
-        if not self.result_id:
-            self.result_id = f"RESULT-{uuid.uuid4().hex[:8].upper()}"
-            logger.info(f"Generated result_id: {self.result_id}")
-        
-        super().save(*args, **kwargs)
+        indexes = [
+            # User history: filter by user, newest first
+            models.Index(fields=['user', '-played_at'], name='gr_user_played_idx'),
+            # Team/game drill-down, newest first
+            models.Index(fields=['team', 'game', '-played_at'], name='gr_team_game_idx'),
+            # Per-game rankings ordered by score
+            models.Index(fields=['game', '-points_scored'], name='gr_game_points_idx'),
+        ]
     
     def __str__(self):
         try:
@@ -5,10 +5,73 @@ Custom MongoDB backend to handle existing data and fix djongo issues.
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
 import logging
+import threading
+import time
+
+from .mongodb_queries import MongoDBQueryHelper
 
 logger = logging.getLogger(__name__)
 
+# Per-thread cache of resolved users: DRF touches request.user two or
+# three times per request (authentication, permissions, serializers), and
+# each miss here is a Mongo round trip. Entries live a few seconds — the
+# same short-TTL idiom as jwt_cache — and saves/deletes evict eagerly on
+# the writing thread; other threads fall back to the TTL.
+_user_cache = threading.local()
+_USER_CACHE_TTL = 5  # seconds
+
+
+def _cache_get(user_id):
+    entry = getattr(_user_cache, 'users', {}).get(str(user_id))
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+
+def _cache_put(user_id, user):
+    users = getattr(_user_cache, 'users', None)
+    if users is None:
+        users = _user_cache.users = {}
+    users[str(user_id)] = (user, time.monotonic() + _USER_CACHE_TTL)
+
+
+def _cache_evict(sender, instance, **kwargs):
+    users = getattr(_user_cache, 'users', None)
+    if users is not None:
+        users.pop(str(instance.pk), None)
+
+
+post_save.connect(_cache_evict, sender='users.User')
+post_delete.connect(_cache_evict, sender='users.User')
+
+# Module-level helper, created on first use: it rides the shared pooled
+# client, so there is no reason to rebuild it per authenticate()/get_user()
+# call — and building it lazily keeps Atlas SRV resolution off import time
+_mongo_helper = None
+
+
+def _get_helper():
+    global _mongo_helper
+    if _mongo_helper is None:
+        _mongo_helper = MongoDBQueryHelper()
+    return _mongo_helper
+
+
+# get_user_model() walks settings.AUTH_USER_MODEL through the app
+# registry on every call; resolve it once on first use (lazily — the
+# registry isn't ready at import time)
+_user_model = None
+
+
+def _get_user_model():
+    global _user_model
+    if _user_model is None:
+        _user_model = get_user_model()
+    return _user_model
+
 
 class MongoDBUserBackend(ModelBackend):
     """
@@ -25,12 +88,18 @@ class MongoDBUserBackend(ModelBackend):
         
         try:
             # Use custom MongoDB query helper
-            from .mongodb_queries import MongoDBQueryHelper
-            mongo_helper = MongoDBQueryHelper()
+            mongo_helper = _get_helper()
             # Include password for authentication
-            user = mongo_helper.get_user_by_email(username, include_password=True)
+            user = mongo_helper.get_user_by_email(username, include_password=True,
+                                                  only_active=True)
             
             if user and user.check_password(password):
+                # Stamp last_login with one primary-key UPDATE instead of
+                # the ORM save cycle the user_logged_in signal would run
+                # (the signal is disconnected in users.apps)
+                now = timezone.now()
+                if mongo_helper.update_user_last_login(user.pk, now):
+                    user.last_login = now
                 logger.info(f"User authenticated: {user.email}")
                 return user
             else:
@@ -47,21 +116,34 @@ class MongoDBUserBackend(ModelBackend):
         """
         Get user by ID with MongoDB fallback.
         """
-        User = get_user_model()
+        cached = _cache_get(user_id)
+        if cached is not None:
+            return cached
+
+        User = _get_user_model()
         try:
-            # Try Django ORM first
-            user = User.objects.filter(pk=user_id).first()
+            # Try Django ORM first. This runs for every authenticated
+            # request, so project just the fields the request cycle needs:
+            # qr_image and date_joined stay deferred (they load lazily on
+            # the few endpoints that serialize the full profile)
+            user = User.objects.filter(pk=user_id).only(
+                'email', 'name', 'role', 'qr_id', 'is_active',
+                'is_staff', 'is_superuser', 'password', 'last_login',
+            ).first()
             if user:
+                _cache_put(user_id, user)
                 return user
         except Exception as e:
             logger.warning(f"ORM get_user failed for {user_id}: {e}")
         
         # Fallback to MongoDB direct query
         try:
-            from .mongodb_queries import MongoDBQueryHelper
             from bson import ObjectId
-            
-            mongo_helper = MongoDBQueryHelper()
+
+            mongo_helper = _get_helper()
+            # No projection here: _create_user_from_data repairs missing
+            # qr_id/qr_image fields, so it needs the full document to tell
+            # "absent from the projection" apart from "absent in the DB"
             # Try to get user by ObjectId
             try:
                 user_data = mongo_helper.collection.find_one({'_id': ObjectId(user_id)})
@@ -72,6 +154,7 @@ class MongoDBUserBackend(ModelBackend):
             if user_data:
                 user = mongo_helper._create_user_from_data(user_data)
                 logger.info(f"User retrieved from MongoDB fallback: {user_id}")
+                _cache_put(user_id, user)
                 return user
         except Exception as e:
             logger.error(f"MongoDB fallback get_user failed for {user_id}: {e}")
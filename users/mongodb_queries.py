@@ -19,17 +19,24 @@ class MongoDBQueryHelper:
     """
     
     def __init__(self):
-        self.client = pymongo.MongoClient(settings.DATABASES['default']['CLIENT']['host'])
+        # Reuse the process-wide pooled client from utils.mongo instead of
+        # building a fresh MongoClient (TCP + TLS + auth handshake) per
+        # instantiation — this helper is constructed on every login
+        from utils.mongo import get_client
+        self.client = get_client()
         self.db = self.client[settings.DATABASES['default']['NAME']]
         self.collection = self.db['users_user']
     
-    def get_user_by_email(self, email: str, include_password: bool = False) -> Optional[object]:
+    def get_user_by_email(self, email: str, include_password: bool = False,
+                          only_active: bool = False) -> Optional[object]:
         """
         Get user by email using direct MongoDB query with caching.
-        
+
         Args:
             email: User email address
             include_password: If True, include password hash (for authentication)
+            only_active: If True, match active users only — this query shape
+                covers the (email, is_active) compound index on the login path
         """
         # Check cache first (but only if not including password, as cached users won't have password)
         if not include_password:
@@ -42,10 +49,10 @@ class MongoDBQueryHelper:
         try:
             # Include password if needed for authentication
             projection = {} if include_password else {'password': 0}
-            user_data = self.collection.find_one(
-                {'email': email.lower()},
-                projection
-            )
+            query = {'email': email.lower()}
+            if only_active:
+                query['is_active'] = True
+            user_data = self.collection.find_one(query, projection)
             
             if user_data:
                 user = self._create_user_from_data(user_data)
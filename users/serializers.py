@@ -164,7 +164,8 @@ class UserLoginSerializer(serializers.Serializer):
                 from .mongodb_queries import MongoDBQueryHelper
                 mongo_helper = MongoDBQueryHelper()
                 # Include password for authentication
-                mongo_user = mongo_helper.get_user_by_email(email, include_password=True)
+                mongo_user = mongo_helper.get_user_by_email(email, include_password=True,
+                                                            only_active=True)
 
                 if mongo_user and mongo_user.is_active:
                     try:
@@ -0,0 +1,74 @@
+"""
+Background tasks for the users app.
+
+There is no task queue in this deployment (Vercel serverless — no Celery
+broker to run a worker against), so "background" means a process-local
+thread pool: the request hands the work off and responds immediately,
+and the thread finishes inside the same warm invocation.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Single worker: the PNG encode is CPU-light but the storage write isn't,
+# and one lane keeps concurrent logins from racing on the same file
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qr-tasks')
+
+
+def generate_qr_for_user(user_id):
+    """
+    Generate and store the QR image for a user, then record its path.
+
+    Records the path with a single filter().update()/update_one — no
+    model save(), so none of the User.save hooks re-run.
+    """
+    from django.core.files.storage import default_storage
+    from django.db import connections
+    from users.models import User
+    from utils.qr_generator import generate_qr_code
+
+    try:
+        user = User.objects.filter(pk=user_id).first()
+        if user is not None:
+            qr_id, name, doc_id = user.qr_id, user.name, None
+        else:
+            # Users resolved through the Mongo fallback helper carry
+            # pk = str(document _id), which djongo's pk filter (the id
+            # column) never matches — look the document up by _id instead,
+            # like MongoDBQueryHelper.update_user_last_login does
+            from bson import ObjectId
+            from users.mongodb_queries import MongoDBQueryHelper
+            collection = MongoDBQueryHelper().collection
+            try:
+                doc = collection.find_one(
+                    {'_id': ObjectId(user_id)}, {'qr_id': 1, 'name': 1}
+                )
+            except Exception:
+                doc = collection.find_one({'_id': user_id}, {'qr_id': 1, 'name': 1})
+            if doc is None:
+                logger.warning(f"Background QR generation found no user for {user_id}")
+                return
+            qr_id, name, doc_id = doc.get('qr_id'), doc.get('name', ''), doc['_id']
+
+        if not qr_id:
+            logger.warning(f"Background QR generation skipped, no qr_id for {user_id}")
+            return
+        file_path, file_content = generate_qr_code(qr_id, name)
+        default_storage.save(file_path, file_content)
+        if doc_id is None:
+            User.objects.filter(pk=user_id).update(qr_image=file_path)
+        else:
+            collection.update_one({'_id': doc_id}, {'$set': {'qr_image': file_path}})
+        logger.info(f"Background QR generation finished for user {user_id}")
+    except Exception as e:
+        logger.error(f"Background QR generation failed for user {user_id}: {e}")
+    finally:
+        # Worker threads get their own thread-local connection
+        connections['default'].close()
+
+
+def enqueue_generate_qr(user_id):
+    """Run generate_qr_for_user off the request path."""
+    _EXECUTOR.submit(generate_qr_for_user, user_id)
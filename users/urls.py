@@ -14,6 +14,7 @@ from .views import (
     UserDeleteView,
     CurrentUserView,
     DebugLoginView,
+    BatchDebugView,
     TeamListCreateView,
     TeamDetailView,
     GameListView,
@@ -29,6 +30,7 @@ urlpatterns = [
     path('register/', UserRegistrationView.as_view(), name='register'),
     path('login/', UserLoginView.as_view(), name='login'),
     path('debug/login/', DebugLoginView.as_view(), name='debug-login'),
+    path('_debug/batch/', BatchDebugView.as_view(), name='debug-batch'),
     path('logout/', UserLogoutView.as_view(), name='logout'),
     
     # QR verification endpoint (for Raspberry Pi)
@@ -137,21 +137,14 @@ class UserLoginView(APIView):
         from utils.qr_generator import get_qr_code_url
         qr_url = get_qr_code_url(request, user.qr_id)
 
-        # If QR URL is not available, try to regenerate
+        # If QR URL is not available, regenerate off the request path: the
+        # PNG encode + storage write used to block the login response (and
+        # its DB connection) for the whole upload. The URL stays null on
+        # this response and resolves once the background worker has
+        # written the file.
         if not qr_url:
-            try:
-                from utils.qr_generator import generate_qr_code
-                file_path, file_content = generate_qr_code(user.qr_id, user.name)
-
-                # Save to media directory
-                from django.core.files.storage import default_storage
-                default_storage.save(file_path, file_content)
-
-                # Get URL again
-                qr_url = get_qr_code_url(request, user.qr_id)
-            except Exception as e:
-                logger.error(f"Error generating QR code during login: {e}")
-                qr_url = None
+            from users.tasks import enqueue_generate_qr
+            enqueue_generate_qr(getattr(user, 'pk', None) or getattr(user, 'id', None))
 
         # Generate tokens
         tokens = get_tokens_for_user(user)
@@ -552,6 +545,42 @@ class DebugLoginView(APIView):
             logger.error(f"Debug login error: {e}")
             return Response({"detail": "Internal server error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+class BatchDebugView(APIView):
+    """
+    POST /api/_debug/batch/
+    DEBUG-only: Run several read-only endpoints in one request.
+
+    Accepts {"ops": ["me", "users", "teams", "games", "results"]} and
+    returns a map of op name to that endpoint's payload. Lets test
+    scripts pay one round trip (cold start + TLS) instead of one per
+    endpoint.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    # Each op delegates to the existing view in-process so response
+    # shapes stay identical to the standalone endpoints
+    _OPS = {
+        'me': lambda request: CurrentUserView().get(request),
+        'users': lambda request: UserListView().get(request),
+        'teams': lambda request: TeamListCreateView().get(request),
+        'games': lambda request: GameListView().get(request),
+        'results': lambda request: GameResultListCreateView().get(request),
+    }
+
+    def post(self, request):
+        if not getattr(settings, 'DEBUG', False):
+            return Response({"detail": "Not available"}, status=status.HTTP_404_NOT_FOUND)
+        ops = request.data.get('ops') or []
+        unknown = [op for op in ops if op not in self._OPS]
+        if unknown:
+            return Response({'error': f"Unknown ops: {unknown}"}, status=status.HTTP_400_BAD_REQUEST)
+        payload = {}
+        for op in ops:
+            response = self._OPS[op](request)
+            payload[op] = response.data
+        return Response(payload, status=status.HTTP_200_OK)
+
+
 class TeamListCreateView(APIView):
     """
     GET /api/teams/ - List all teams for authenticated user
@@ -712,7 +741,7 @@ class AdminGameManagementView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def post(self, request):
-        if not request.user.is_admin():
+        if not request.user.is_admin:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         try:
             serializer = GameSerializer(data=request.data, context={'request': request})
@@ -727,7 +756,7 @@ class AdminGameManagementView(APIView):
             return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def put(self, request, game_id=None):
-        if not request.user.is_admin():
+        if not request.user.is_admin:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         try:
             game = Game.objects.filter(game_id=game_id).first()
@@ -754,7 +783,7 @@ class AdminResultManagementView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request):
-        if not request.user.is_admin():
+        if not request.user.is_admin:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         try:
             user_id = request.query_params.get('user_id')
@@ -781,7 +810,7 @@ class AdminResultManagementView(APIView):
     
     def post(self, request):
         """Create a result for any user (admin only)"""
-        if not request.user.is_admin():
+        if not request.user.is_admin:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         try:
             data = request.data.copy()
@@ -879,7 +908,7 @@ class AdminResultManagementView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     def put(self, request, result_id):
-        if not request.user.is_admin():
+        if not request.user.is_admin:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         try:
             result = GameResult.objects.filter(result_id=result_id).first()
@@ -0,0 +1,67 @@
+"""
+Shared MongoDB client for scripts and management commands.
+
+Atlas SRV resolution plus the TLS handshake costs roughly 0.5-2s per
+MongoClient, so scripts should call get_client() instead of building
+their own client — the cached client is reused for the whole process
+(and survives warm serverless invocations as a module-level singleton).
+"""
+
+import functools
+import os
+
+from pymongo import MongoClient
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Return a process-wide MongoClient, created on first use."""
+    mongo_uri = os.getenv('MONGODB_URI')
+    if not mongo_uri:
+        # Fall back to the URI configured in Django settings
+        from django.conf import settings
+        mongo_uri = settings.MONGODB_URI
+    # Pooling knobs tuned for serverless: keep one warm connection, cap the
+    # pool, recycle idle sockets, and compress text-heavy docs on the wire.
+    # zlib only: it ships with the stdlib, whereas naming zstd/snappy
+    # without their codec packages installed just makes pymongo warn on
+    # every client build and negotiate nothing.
+    return MongoClient(
+        mongo_uri,
+        maxPoolSize=10,
+        minPoolSize=1,
+        maxIdleTimeMS=60000,
+        serverSelectionTimeoutMS=3000,
+        compressors='zlib',
+    )
+
+
+def get_db(db_name=None):
+    """Return a database handle from the shared client."""
+    if db_name is None:
+        db_name = os.getenv('MONGODB_DBNAME', 'qr_access_system')
+    return get_client()[db_name]
+
+
+# Diagnostic helpers: prefer plain find/metadata reads over aggregation
+# pipelines, which carry fixed overhead even on tiny collections.
+
+def quick_count(coll):
+    """Collection size from metadata — O(1), no COUNT scan."""
+    return coll.estimated_document_count()
+
+
+def first_doc(coll, fields):
+    """First document with only the requested fields projected."""
+    return coll.find_one({}, projection={f: 1 for f in fields})
+
+
+@functools.lru_cache(maxsize=8)
+def cached_collections(db_name=None):
+    """
+    Collection names for a database, cached per process.
+
+    Saves a listCollections RPC for every caller after the first; call
+    cached_collections.cache_clear() after creating/dropping collections.
+    """
+    return tuple(get_db(db_name).list_collection_names())